@@ -20,6 +20,7 @@ Usage:
 import requests
 import time
 import json
+import math
 from datetime import datetime
 from pathlib import Path
 
@@ -64,11 +65,15 @@ def get_balance():
     except:
         return 1000.0  # Allow trades, let API reject if insufficient
 
+_USD_UNITS = (("", 1.0, ".0f"), ("K", 1e3, ".1f"), ("M", 1e6, ".1f"))
+
 def fmt_usd(v):
     """Format USD value."""
-    if v >= 1_000_000: return f"${v/1_000_000:.1f}M"
-    if v >= 1_000: return f"${v/1_000:.1f}K"
-    return f"${v:.0f}"
+    i = min(2, int(math.log10(v)) // 3) if v >= 1 else 0
+    if i and v < _USD_UNITS[i][1]:  # log10 rounds up just below a power of 10
+        i -= 1
+    label, div, spec = _USD_UNITS[i]
+    return f"${v/div:{spec}}{label}"
 
 def fmt_price(p):
     """Format price as cents."""
@@ -28,8 +28,10 @@ from dataclasses import dataclass, field
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils import fmt_price
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PricePoint:
     """Single price observation."""
     timestamp: datetime
@@ -38,7 +40,7 @@ class PricePoint:
     ask: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpikeEvent:
     """Detected price spike."""
     market_id: str
@@ -128,22 +130,33 @@ class SpikeDetector:
         return None
 
 
-def format_spike_alert(spike: SpikeEvent) -> str:
-    """Format spike event as alert string."""
-    arrow = "↑" if spike.direction == "UP" else "↓"
-    return f"""
+# Built once; format_spike_alert only fills in the per-spike fields
+_ALERT_TEMPLATE = """
 ┌─────────────────────────────────────────────────────────────┐
 │  🚨 SPIKE DETECTED                                          │
 ├─────────────────────────────────────────────────────────────┤
-│  Market:    {spike.market_id:<46}│
-│  Direction: {spike.direction} {arrow:<45}│
-│  Change:    {spike.change_pct*100:+.1f}%{' '*42}│
-│  Price:     {spike.old_price*100:.0f}¢ → {spike.new_price*100:.0f}¢{' '*35}│
-│  Time:      {spike.timestamp.strftime('%H:%M:%S'):<46}│
+│  Market:    {market_id:<46}│
+│  Direction: {direction} {arrow:<45}│
+│  Change:    {change:+.1f}%                                          │
+│  Price:     {old} → {new}                                   │
+│  Time:      {ts:<46}│
 └─────────────────────────────────────────────────────────────┘
 """
 
 
+def format_spike_alert(spike: SpikeEvent) -> str:
+    """Format spike event as alert string."""
+    return _ALERT_TEMPLATE.format(
+        market_id=spike.market_id,
+        direction=spike.direction,
+        arrow="↑" if spike.direction == "UP" else "↓",
+        change=spike.change_pct * 100,
+        old=fmt_price(spike.old_price),
+        new=fmt_price(spike.new_price),
+        ts=spike.timestamp.strftime('%H:%M:%S'),
+    )
+
+
 def demo_spike_detection():
     """Demonstrate spike detection concept."""
     print("""
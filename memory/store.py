@@ -3,7 +3,9 @@
 Trading Memory Store
 Persistent knowledge that improves across sessions
 """
+import os
 import json
+import atexit
 import hashlib
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +18,8 @@ MEMORY_DIR.mkdir(exist_ok=True)
 KNOWLEDGE_FILE = MEMORY_DIR / "knowledge.json"
 PATTERNS_FILE = MEMORY_DIR / "patterns.json"
 HISTORY_FILE = MEMORY_DIR / "trade_history.json"
+# Append-only log of query/trade records since the last checkpoint
+LOG_FILE = MEMORY_DIR / "memory.log"
 
 
 class TradingMemory:
@@ -28,6 +32,9 @@ class TradingMemory:
         self.knowledge = self._load(KNOWLEDGE_FILE, default={"facts": {}, "insights": []})
         self.patterns = self._load(PATTERNS_FILE, default={"successful": [], "failed": []})
         self.history = self._load(HISTORY_FILE, default={"trades": [], "queries": []})
+        self._pending = 0  # Logged records not yet in HISTORY_FILE
+        self._log_fd = None
+        self._replay()
 
     def _load(self, path: Path, default: dict) -> dict:
         """Load JSON file or return default"""
@@ -39,14 +46,56 @@ class TradingMemory:
         return default
 
     def _save(self, path: Path, data: dict):
-        """Save data to JSON file"""
-        path.write_text(json.dumps(data, indent=2, default=str))
+        """Save data to JSON file (atomically, so a crash can't leave it half-written)"""
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2, default=str))
+        os.replace(tmp, path)
 
     def save_all(self):
         """Persist all memory to disk"""
         self._save(KNOWLEDGE_FILE, self.knowledge)
         self._save(PATTERNS_FILE, self.patterns)
         self._save(HISTORY_FILE, self.history)
+        self._truncate_log()
+
+    def checkpoint(self):
+        """Snapshot logged history records into HISTORY_FILE and reset the log"""
+        if self._pending:
+            self._save(HISTORY_FILE, self.history)
+            self._truncate_log()
+
+    # ==================== Write-Ahead Log ====================
+
+    def _append_log(self, kind: str, record: dict):
+        """Durably note a history record: one append, no rewrite of the JSON files"""
+        if self._log_fd is None:
+            self._log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        line = json.dumps({"kind": kind, "record": record}, default=str)
+        os.write(self._log_fd, line.encode() + b"\n")
+        self._pending += 1
+
+    def _truncate_log(self):
+        if self._log_fd is not None:
+            os.ftruncate(self._log_fd, 0)
+        elif LOG_FILE.exists():
+            LOG_FILE.write_bytes(b"")
+        self._pending = 0
+
+    def _replay(self):
+        """Apply records logged after the last checkpoint (e.g. before a crash)"""
+        if not LOG_FILE.exists():
+            return
+        for line in LOG_FILE.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn final line
+            if entry.get("kind") == "trade":
+                self._add_trade(entry["record"])
+            elif entry.get("kind") == "query":
+                self._add_query(entry["record"])
+            self._pending += 1
+        self.checkpoint()
 
     # ==================== Knowledge Management ====================
 
@@ -142,21 +191,28 @@ class TradingMemory:
     def record_trade(self, trade: dict):
         """Record a trade for history"""
         trade["timestamp"] = datetime.now().isoformat()
-        self.history["trades"].append(trade)
-        self.history["trades"] = self.history["trades"][-500:]
-        self.save_all()
+        self._add_trade(trade)
+        self._append_log("trade", trade)
 
     def record_query(self, query: str, result_summary: str):
         """Record a query to avoid repeating research"""
         query_hash = hashlib.md5(query.lower().encode()).hexdigest()[:8]
-        self.history["queries"].append({
+        record = {
             "hash": query_hash,
             "query": query,
             "result": result_summary,
             "timestamp": datetime.now().isoformat(),
-        })
+        }
+        self._add_query(record)
+        self._append_log("query", record)
+
+    def _add_trade(self, trade: dict):
+        self.history["trades"].append(trade)
+        self.history["trades"] = self.history["trades"][-500:]
+
+    def _add_query(self, record: dict):
+        self.history["queries"].append(record)
         self.history["queries"] = self.history["queries"][-200:]
-        self.save_all()
 
     def find_similar_query(self, query: str) -> Optional[dict]:
         """Check if we've answered a similar query before"""
@@ -211,6 +267,7 @@ class TradingMemory:
 
 # Global memory instance
 memory = TradingMemory()
+atexit.register(memory.checkpoint)  # Clean exit leaves an empty log
 
 
 def get_memory() -> TradingMemory:
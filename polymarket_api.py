@@ -8,6 +8,8 @@ Tested and verified for Claude Code trading.
 import os
 import sys
 import json
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 # Add parent for config access (3 levels up to dashboard4all)
@@ -19,6 +21,10 @@ VENV_SITE = PARENT / ".venv/lib/python3.12/site-packages"
 if VENV_SITE.exists():
     sys.path.insert(0, str(VENV_SITE))
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType
 
@@ -33,6 +39,80 @@ _TOKEN_CACHE = {}  # market_id -> {yes: token_id, no: token_id}
 _MARKET_CACHE = {}  # market_id -> market_data
 _CLIENT = None  # Singleton client
 
+# Short-lived LRU caches for repeated lookups within a session
+CACHE_TTL = 30  # Seconds; keeps prices in search/event results fresh
+CACHE_MAXSIZE = 512
+_SEARCH_CACHE = OrderedDict()  # (query, limit) -> (monotonic time, results)
+_EVENT_CACHE = OrderedDict()  # slug -> (monotonic time, event)
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+# Shared keep-alive HTTP session: one TCP+TLS handshake per host, not per request.
+# With httpx[http2], concurrent tool calls (threads) multiplex over one connection.
+try:
+    import httpx
+    import h2  # noqa: F401 - required for http2=True
+
+    SESSION = httpx.Client(
+        headers={"User-Agent": "ClaudeTrading/1.0"},
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        follow_redirects=True,  # Same as requests
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        ),
+    )
+except ImportError:
+    SESSION = requests.Session()
+    SESSION.headers["User-Agent"] = "ClaudeTrading/1.0"
+    SESSION.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ))
+
+KEEPALIVE_URLS = ("https://gamma-api.polymarket.com/", "https://clob.polymarket.com/time")
+
+
+def _get_json(url: str, timeout: float, default):
+    """GET url over the shared session; default on any error"""
+    try:
+        resp = SESSION.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+    except Exception:
+        return default
+
+
+def _ttl_get(cache: OrderedDict, key):
+    """Cached value if present and younger than CACHE_TTL, else None"""
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < CACHE_TTL:
+        cache.move_to_end(key)
+        CACHE_STATS["hits"] += 1
+        return entry[1]
+    CACHE_STATS["misses"] += 1
+    return None
+
+
+def _ttl_put(cache: OrderedDict, key, value):
+    """Store value (empty/failed lookups are not cached), evicting least recently used"""
+    if value:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        if len(cache) > CACHE_MAXSIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def keep_alive():
+    """Touch each API host so pooled connections stay warm through idle periods"""
+    for url in KEEPALIVE_URLS:
+        try:
+            SESSION.get(url, timeout=2)
+        except Exception:
+            pass
+
 def load_config():
     """Load trading configuration"""
     if CONFIG_FILE.exists():
@@ -92,39 +172,25 @@ def get_open_orders():
 
 def get_event_by_slug(slug: str):
     """Get event details by slug (from URL)"""
-    import urllib.request
-    import ssl
+    cached = _ttl_get(_EVENT_CACHE, slug)
+    if cached is not None:
+        return cached
 
     url = f"https://gamma-api.polymarket.com/events/slug/{slug}"
-    req = urllib.request.Request(url, headers={'User-Agent': 'ClaudeTrading/1.0'})
-    ctx = ssl.create_default_context()
-
-    try:
-        with urllib.request.urlopen(req, timeout=15, context=ctx) as resp:
-            return json.loads(resp.read())
-    except:
-        return None
+    return _ttl_put(_EVENT_CACHE, slug, _get_json(url, 15, None))
 
 def get_gamma_market(market_id: str, use_cache: bool = True):
     """Get market details from Gamma API (with cache)"""
-    import urllib.request
-    import ssl
-
     # Check cache first
     if use_cache and market_id in _MARKET_CACHE:
         return _MARKET_CACHE[market_id]
 
     url = f"https://gamma-api.polymarket.com/markets/{market_id}"
-    req = urllib.request.Request(url, headers={'User-Agent': 'ClaudeTrading/1.0'})
-    ctx = ssl.create_default_context()
-
-    try:
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
-            data = json.loads(resp.read())
-            _MARKET_CACHE[market_id] = data
-            return data
-    except:
+    data = _get_json(url, 10, None)
+    if data is None:
         return {}
+    _MARKET_CACHE[market_id] = data
+    return data
 
 def get_clob_token_id(market_id: str, outcome: str = "yes"):
     """Convert market_id to CLOB token_id (with cache)"""
@@ -155,19 +221,15 @@ def get_clob_token_id(market_id: str, outcome: str = "yes"):
 
 def search_markets(query: str, limit: int = 10):
     """Search markets via Gamma API"""
-    import urllib.request
-    import ssl
     from urllib.parse import quote
 
-    url = f"https://gamma-api.polymarket.com/markets?_q={quote(query)}&limit={limit}&active=true"
-    req = urllib.request.Request(url, headers={'User-Agent': 'ClaudeTrading/1.0'})
-    ctx = ssl.create_default_context()
+    key = (query.strip().lower(), limit)
+    cached = _ttl_get(_SEARCH_CACHE, key)
+    if cached is not None:
+        return cached
 
-    try:
-        with urllib.request.urlopen(req, timeout=15, context=ctx) as resp:
-            return json.loads(resp.read())
-    except:
-        return []
+    url = f"https://gamma-api.polymarket.com/markets?_q={quote(query)}&limit={limit}&active=true"
+    return _ttl_put(_SEARCH_CACHE, key, _get_json(url, 15, []))
 
 # =============================================================================
 # PRICE & ORDERBOOK (WORKING)
@@ -359,22 +421,22 @@ def show_event(slug: str):
 
     return markets
 
-def show_orders():
-    """Show all open orders - professional format"""
-    orders = get_open_orders()
-
-    print()
-    print(f"  \033[1;36m▶ OPEN ORDERS\033[0m")
-    print(f"  \033[90m{'─'*60}\033[0m")
+def format_orders(orders: list) -> str:
+    """Render open orders as the professional table (no I/O)"""
+    lines = [
+        "",
+        f"  \033[1;36m▶ OPEN ORDERS\033[0m",
+        f"  \033[90m{'─'*60}\033[0m",
+    ]
 
     if not orders:
-        print(f"  \033[90m  No open orders\033[0m")
-        print()
-        return []
+        lines.append(f"  \033[90m  No open orders\033[0m")
+        lines.append("")
+        return "\n".join(lines)
 
-    print()
-    print(f"  \033[90m│\033[0m {'Side':<6} \033[90m│\033[0m {'Price':^8} \033[90m│\033[0m {'Size':^8} \033[90m│\033[0m {'Order ID':<32} \033[90m│\033[0m")
-    print(f"  \033[90m├{'─'*7}┼{'─'*9}┼{'─'*9}┼{'─'*33}┤\033[0m")
+    lines.append("")
+    lines.append(f"  \033[90m│\033[0m {'Side':<6} \033[90m│\033[0m {'Price':^8} \033[90m│\033[0m {'Size':^8} \033[90m│\033[0m {'Order ID':<32} \033[90m│\033[0m")
+    lines.append(f"  \033[90m├{'─'*7}┼{'─'*9}┼{'─'*9}┼{'─'*33}┤\033[0m")
 
     for o in orders:
         side = o.get('side', 'BUY')
@@ -383,10 +445,16 @@ def show_orders():
         oid = o.get('id', '')[:30]
 
         side_color = "\033[92m" if side == "BUY" else "\033[91m"
-        print(f"  \033[90m│\033[0m {side_color}{side:<6}\033[0m \033[90m│\033[0m {price:>6.0f}¢  \033[90m│\033[0m {size:^8} \033[90m│\033[0m \033[90m{oid:<32}\033[0m \033[90m│\033[0m")
+        lines.append(f"  \033[90m│\033[0m {side_color}{side:<6}\033[0m \033[90m│\033[0m {price:>6.0f}¢  \033[90m│\033[0m {size:^8} \033[90m│\033[0m \033[90m{oid:<32}\033[0m \033[90m│\033[0m")
 
-    print(f"  \033[90m└{'─'*7}┴{'─'*9}┴{'─'*9}┴{'─'*33}┘\033[0m")
-    print()
+    lines.append(f"  \033[90m└{'─'*7}┴{'─'*9}┴{'─'*9}┴{'─'*33}┘\033[0m")
+    lines.append("")
+    return "\n".join(lines)
+
+def show_orders():
+    """Show all open orders - professional format"""
+    orders = get_open_orders()
+    print(format_orders(orders))
     return orders
 
 def show_orderbook(market_id: str, outcome: str = "yes"):
@@ -488,19 +556,19 @@ def get_market_info(market_id: str):
 
 def get_recent_trades(market_id: str, limit: int = 10):
     """Get recent trades for a market"""
-    import urllib.request
-    import ssl
-
     token_id = get_clob_token_id(market_id, "yes")
     url = f"https://clob.polymarket.com/trades?token_id={token_id}&limit={limit}"
-    req = urllib.request.Request(url, headers={'User-Agent': 'ClaudeTrading/1.0'})
-    ctx = ssl.create_default_context()
+    return _get_json(url, 10, [])
 
-    try:
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as resp:
-            return json.loads(resp.read())
-    except:
-        return []
+
+def cache_stats():
+    """Hit/miss counts and sizes of the search/event caches"""
+    return {
+        **CACHE_STATS,
+        "search_entries": len(_SEARCH_CACHE),
+        "event_entries": len(_EVENT_CACHE),
+        "ttl": CACHE_TTL,
+    }
 
 
 def clear_caches():
@@ -508,6 +576,8 @@ def clear_caches():
     global _TOKEN_CACHE, _MARKET_CACHE, _CLIENT
     _TOKEN_CACHE = {}
     _MARKET_CACHE = {}
+    _SEARCH_CACHE.clear()
+    _EVENT_CACHE.clear()
     _CLIENT = None
     return "Caches cleared"
 
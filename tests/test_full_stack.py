@@ -21,6 +21,7 @@ import os
 import sys
 import json
 import time
+import socket
 from pathlib import Path
 from datetime import datetime
 
@@ -28,13 +29,28 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-# Test results tracking
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj).encode()
+
+RESULTS_FILE = PROJECT_ROOT / "tests" / "last_run.json"
+RESULTS_LOG = PROJECT_ROOT / "tests" / "last_run.ndjson"
+
+# Test results tracking - per-test records stream to RESULTS_LOG, only
+# failures are kept in memory for the summary printout
 RESULTS = {
     "passed": 0,
     "failed": 0,
     "skipped": 0,
-    "tests": []
+    "failures": []
 }
+_results_fp = None  # Opened by run_all(); None under pytest
+
+# Phases that need Polymarket reachable; skipped wholesale when offline
+NETWORK_PHASES = {"api", "market_data", "account", "automation", "integration"}
+_offline = False  # Set by run_all() from a single TCP probe
 
 def log(msg, level="INFO"):
     """Print with timestamp and level."""
@@ -43,30 +59,44 @@ def log(msg, level="INFO"):
     colors = {"INFO": "\033[0m", "PASS": "\033[92m", "FAIL": "\033[91m", "SKIP": "\033[93m", "WARN": "\033[93m"}
     print(f"{colors.get(level, '')}{symbols.get(level, '•')} [{ts}] {msg}\033[0m")
 
+def record(name, phase, status, error=None):
+    """Count a test result and append it to the NDJSON run log."""
+    entry = {"name": name, "phase": phase, "status": status}
+    if status == "PASS":
+        RESULTS["passed"] += 1
+    elif status == "SKIP":
+        RESULTS["skipped"] += 1
+    else:
+        RESULTS["failed"] += 1
+        entry["error"] = error
+        RESULTS["failures"].append(entry)
+    if _results_fp is not None:
+        _results_fp.write(_dumps(entry) + b"\n")
+
 def test(name, phase):
     """Decorator for test functions."""
     def decorator(func):
         def wrapper(*args, **kwargs):
+            if _offline and phase in NETWORK_PHASES:
+                record(name, phase, "SKIP")
+                log(f"{name} (skipped, offline)", "SKIP")
+                return None
             try:
                 result = func(*args, **kwargs)
                 if result is None or result is True:
-                    RESULTS["passed"] += 1
-                    RESULTS["tests"].append({"name": name, "phase": phase, "status": "PASS"})
+                    record(name, phase, "PASS")
                     log(f"{name}", "PASS")
                     return True
                 elif result == "SKIP":
-                    RESULTS["skipped"] += 1
-                    RESULTS["tests"].append({"name": name, "phase": phase, "status": "SKIP"})
+                    record(name, phase, "SKIP")
                     log(f"{name} (skipped)", "SKIP")
                     return None
                 else:
-                    RESULTS["failed"] += 1
-                    RESULTS["tests"].append({"name": name, "phase": phase, "status": "FAIL", "error": str(result)})
+                    record(name, phase, "FAIL", str(result))
                     log(f"{name}: {result}", "FAIL")
                     return False
             except Exception as e:
-                RESULTS["failed"] += 1
-                RESULTS["tests"].append({"name": name, "phase": phase, "status": "FAIL", "error": str(e)})
+                record(name, phase, "FAIL", str(e))
                 log(f"{name}: {e}", "FAIL")
                 return False
         return wrapper
@@ -513,20 +543,36 @@ def test_display():
 # MAIN
 # =============================================================================
 
+def has_network(host="clob.polymarket.com", port=443, timeout=2):
+    """Probe Polymarket once so offline runs skip instead of timing out."""
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+_RESET = "\033[0m"
+_FAIL_COLOR = "\033[91m"
+_SEP = "=" * 60
+_CYAN_HDR = f"\033[1;36m{_SEP}{_RESET}"
+_BOLD_HDR = f"\033[1m{_SEP}{_RESET}"
+_MAGENTA_HDR = f"\033[1;35m{_SEP}{_RESET}"
+_DIVIDER = "─" * 13
+
 def print_header(text):
     """Print section header."""
     print()
-    print(f"\033[1;36m{'='*60}\033[0m")
-    print(f"\033[1;36m  {text}\033[0m")
-    print(f"\033[1;36m{'='*60}\033[0m")
+    print(_CYAN_HDR)
+    print(f"\033[1;36m  {text}{_RESET}")
+    print(_CYAN_HDR)
     print()
 
 def print_summary():
     """Print test summary."""
     print()
-    print(f"\033[1m{'='*60}\033[0m")
-    print(f"\033[1m  TEST SUMMARY\033[0m")
-    print(f"\033[1m{'='*60}\033[0m")
+    print(_BOLD_HDR)
+    print(f"\033[1m  TEST SUMMARY{_RESET}")
+    print(_BOLD_HDR)
     print()
 
     total = RESULTS["passed"] + RESULTS["failed"] + RESULTS["skipped"]
@@ -534,20 +580,25 @@ def print_summary():
     print(f"  \033[92m✓ Passed:  {RESULTS['passed']}\033[0m")
     print(f"  \033[91m✗ Failed:  {RESULTS['failed']}\033[0m")
     print(f"  \033[93m⊘ Skipped: {RESULTS['skipped']}\033[0m")
-    print(f"  ─────────────")
+    print(f"  {_DIVIDER}")
     print(f"  Total:   {total}")
     print()
 
-    if RESULTS["failed"] > 0:
-        print("  \033[91mFailed tests:\033[0m")
-        for t in RESULTS["tests"]:
-            if t["status"] == "FAIL":
-                print(f"    • {t['name']}: {t.get('error', 'Unknown error')}")
+    if _offline:
+        print(f"  \033[93m⊘ Network unreachable - skipped phases: {', '.join(sorted(NETWORK_PHASES))}{_RESET}")
         print()
 
-    # Save results
-    results_file = PROJECT_ROOT / "tests" / "last_run.json"
-    with open(results_file, 'w') as f:
+    if RESULTS["failed"] > 0:
+        print(f"  {_FAIL_COLOR}Failed tests:{_RESET}")
+        print("".join(
+            f"    • {t['name']}: {t.get('error', 'Unknown error')}\n"
+            for t in RESULTS["failures"]
+        ))
+
+    # Save summary; per-test results were already streamed to RESULTS_LOG
+    if _results_fp is not None:
+        _results_fp.close()
+    with open(RESULTS_FILE, 'w') as f:
         json.dump({
             "timestamp": datetime.now().isoformat(),
             "summary": {
@@ -555,9 +606,11 @@ def print_summary():
                 "failed": RESULTS["failed"],
                 "skipped": RESULTS["skipped"]
             },
-            "tests": RESULTS["tests"]
+            "offline": _offline,
+            "tests_log": RESULTS_LOG.name
         }, f, indent=2)
-    print(f"  Results saved to: {results_file}")
+    print(f"  Results saved to: {RESULTS_FILE}")
+    print(f"  Per-test log:     {RESULTS_LOG}")
     print()
 
     return RESULTS["failed"] == 0
@@ -565,10 +618,13 @@ def print_summary():
 
 def run_all():
     """Run all tests."""
+    global _results_fp, _offline
+    _results_fp = open(RESULTS_LOG, 'wb', buffering=0)
+
     print()
-    print("\033[1;35m" + "="*60 + "\033[0m")
-    print("\033[1;35m  POLYMARKET TRADING INFRASTRUCTURE TESTS\033[0m")
-    print("\033[1;35m" + "="*60 + "\033[0m")
+    print(_MAGENTA_HDR)
+    print(f"\033[1;35m  POLYMARKET TRADING INFRASTRUCTURE TESTS{_RESET}")
+    print(_MAGENTA_HDR)
     print(f"  Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"  Project: {PROJECT_ROOT}")
 
@@ -582,6 +638,10 @@ def run_all():
     test_clob_client()
     test_requests()
 
+    _offline = not has_network()
+    if _offline:
+        log("Polymarket unreachable - skipping network phases", "WARN")
+
     # Phase 2: API Connectivity
     print_header("PHASE 2: API CONNECTIVITY")
     test_gamma_api()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for memory/store.py - Write-ahead log and checkpoints
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memory import store
+
+
+@pytest.fixture
+def mem(temp_data_dir, monkeypatch):
+    """TradingMemory backed by a temporary directory."""
+    for name in ("KNOWLEDGE_FILE", "PATTERNS_FILE", "HISTORY_FILE", "LOG_FILE"):
+        monkeypatch.setattr(store, name, temp_data_dir / getattr(store, name).name)
+    return store.TradingMemory()
+
+
+class TestHistoryLog:
+    """Tests for logged record_query/record_trade writes."""
+
+    def test_records_logged_until_checkpoint(self, mem):
+        """Test queries go to the log, not the history file, until checkpoint()."""
+        mem.record_query("show orders", "2 orders")
+        assert not store.HISTORY_FILE.exists()
+        assert len(store.LOG_FILE.read_text().splitlines()) == 1
+        assert mem.find_similar_query("show orders") is not None
+
+        mem.checkpoint()
+        saved = json.loads(store.HISTORY_FILE.read_text())
+        assert saved["queries"][0]["query"] == "show orders"
+        assert store.LOG_FILE.read_text() == ""
+
+    def test_replay_after_crash(self, mem):
+        """Test records left in the log are restored by the next instance."""
+        mem.record_trade({"command": "buy 1"})
+        mem.record_query("positions", "none")
+        with open(store.LOG_FILE, "a") as f:
+            f.write('{"kind": "query", "rec')  # Torn write
+
+        restored = store.TradingMemory()
+        assert restored.history["trades"][0]["command"] == "buy 1"
+        assert restored.history["queries"][0]["query"] == "positions"
+        assert json.loads(store.HISTORY_FILE.read_text())["trades"][0]["command"] == "buy 1"
+        assert store.LOG_FILE.read_text() == ""
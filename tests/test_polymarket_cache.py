@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for polymarket_api.py - TTL LRU lookup caches
+"""
+
+import pytest
+from collections import OrderedDict
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Needs requests and py_clob_client importable
+api = pytest.importorskip("polymarket_api")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the cache."""
+    now = [1000.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Tests for _ttl_get/_ttl_put."""
+
+    def test_hit_within_ttl(self, clock):
+        """Test a stored value is returned until it expires."""
+        cache = OrderedDict()
+        api._ttl_put(cache, "k", [1])
+        clock[0] += api.CACHE_TTL - 1
+        assert api._ttl_get(cache, "k") == [1]
+
+    def test_expires_after_ttl(self, clock):
+        """Test entries older than CACHE_TTL miss."""
+        cache = OrderedDict()
+        api._ttl_put(cache, "k", [1])
+        clock[0] += api.CACHE_TTL
+        assert api._ttl_get(cache, "k") is None
+
+    def test_empty_not_cached(self, clock):
+        """Test empty or failed lookups are not stored."""
+        cache = OrderedDict()
+        assert api._ttl_put(cache, "a", []) == []
+        assert api._ttl_put(cache, "b", None) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock, monkeypatch):
+        """Test the oldest-used entry goes when the cache is full."""
+        monkeypatch.setattr(api, "CACHE_MAXSIZE", 2)
+        cache = OrderedDict()
+        api._ttl_put(cache, "a", [1])
+        api._ttl_put(cache, "b", [2])
+        api._ttl_get(cache, "a")  # a is now most recently used
+        api._ttl_put(cache, "c", [3])
+        assert list(cache) == ["a", "c"]
@@ -226,6 +226,14 @@ class TestPricePoint:
         assert point.bid == 0.54
         assert point.ask == 0.56
 
+    def test_price_point_is_immutable(self):
+        """Test price points are frozen and slotted."""
+        point = PricePoint(timestamp=datetime.now(), price=0.55, bid=0.54, ask=0.56)
+
+        assert not hasattr(point, "__dict__")
+        with pytest.raises(AttributeError):
+            point.price = 0.60
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for utils.py - Display formatting helpers
+"""
+
+import math
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils
+from utils import fmt_volume, fmt_time
+
+
+class TestFmtVolume:
+    """Tests for fmt_volume."""
+
+    @pytest.mark.parametrize("vol,expected", [
+        (0, "$0"),
+        (0.4, "$0"),
+        (999, "$999"),
+        (1_000, "$1K"),
+        (50_000, "$50K"),
+        (999_400, "$999K"),
+        (1_000_000, "$1.0M"),
+        (1_500_000, "$1.5M"),
+        (2_500_000_000, "$2500.0M"),
+    ])
+    def test_suffixes(self, vol, expected):
+        """Test each magnitude picks the right suffix."""
+        assert fmt_volume(vol) == expected
+
+    def test_just_below_power_of_ten(self):
+        """Test values that log10 rounds up stay in the lower bucket."""
+        assert fmt_volume(math.nextafter(1_000, 0)) == "$1000"
+        assert fmt_volume(999_999.999999999) == "$1000K"
+
+    def test_negative(self):
+        """Test negative volumes fall back to plain dollars."""
+        assert fmt_volume(-5) == "$-5"
+
+
+class TestFmtTime:
+    """Tests for fmt_time."""
+
+    @pytest.mark.parametrize("ts", [
+        "2024-01-31T12:34:56Z",
+        "2024-01-31T12:34:56.789Z",
+        "2024-01-31T12:34:56+00:00",
+    ])
+    def test_iso_timestamps(self, ts):
+        """Test ISO timestamps with and without the Z fast path."""
+        assert fmt_time(ts) == "12:34:56"
+
+    def test_invalid_falls_back_to_now(self, monkeypatch):
+        """Test unparseable input renders the current time."""
+        monkeypatch.setattr(utils, "_NOW_CACHE", (0, ""))
+        assert fmt_time("not a timestamp Z") == fmt_time()
+
+    def test_now_cached_within_second(self, monkeypatch):
+        """Test the current time is only reformatted when the second changes."""
+        monkeypatch.setattr(utils.time, "time", lambda: 1_700_000_000.2)
+        monkeypatch.setattr(utils, "_NOW_CACHE", (1_700_000_000, "cached"))
+        assert fmt_time() == "cached"
+
+        monkeypatch.setattr(utils.time, "time", lambda: 1_700_000_001.0)
+        assert fmt_time() != "cached"
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for voice/voice_trader.py - Polish command translation
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "voice"))
+
+# Needs the audio stack (sounddevice) importable
+voice_trader = pytest.importorskip("voice_trader")
+translate_polish = voice_trader.translate_polish
+
+
+class TestTranslatePolish:
+    """Tests for translate_polish."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("kup dwa akcji", "buy 2 shares"),
+        ("pokaż zamówienia", "show orders"),
+        ("sprzedaj wszystko, anuluj", "sell all, cancel"),
+        ("kupić pięćdziesiąt", "buy 50"),
+    ])
+    def test_translates_words(self, text, expected):
+        """Test known words map to their English commands."""
+        assert translate_polish(text) == expected
+
+    def test_keeps_whitespace(self):
+        """Test spacing between words is left as spoken."""
+        assert translate_polish("kup  dwa\tpo") == "buy  2\tat"
+
+    def test_uppercase_lowered(self):
+        """Test capitalized transcripts still match."""
+        assert translate_polish("Kup Dwa") == "buy 2"
+
+    def test_whole_words_only(self):
+        """Test keys inside longer words are not replaced."""
+        assert translate_polish("pozycje") == "positions"
+        assert translate_polish("kupon trump") == "kupon trump"
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for voice/wav_fast.py - Minimal WAV writer
+"""
+
+import wave
+import numpy as np
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "voice"))
+
+# Imported directly: the voice package __init__ pulls in the audio stack
+from wav_fast import wav_header, write_wav
+
+
+def _wave_bytes(path: Path, pcm: np.ndarray, sr: int) -> bytes:
+    """Reference output from the stdlib wave module."""
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sr)
+        wf.writeframes(pcm.tobytes())
+    return path.read_bytes()
+
+
+class TestWriteWav:
+    """Tests for wav_header/write_wav."""
+
+    @pytest.mark.parametrize("n,sr", [(0, 16000), (1, 16000), (16000, 16000), (441, 44100)])
+    def test_identical_to_wave(self, tmp_path, n, sr):
+        """Test output is byte-identical to the wave module."""
+        pcm = (np.arange(n, dtype=np.int64) * 37 % 65536 - 32768).astype(np.int16)
+        write_wav(tmp_path / "fast.wav", pcm, sr)
+        assert (tmp_path / "fast.wav").read_bytes() == _wave_bytes(tmp_path / "ref.wav", pcm, sr)
+
+    def test_header_size(self):
+        """Test the header is the canonical 44 bytes."""
+        assert len(wav_header(100)) == 44
+
+    def test_readable_by_wave(self, tmp_path):
+        """Test wave reads back the same samples."""
+        pcm = np.array([0, 1, -1, 32767, -32768], dtype=np.int16)
+        path = write_wav(tmp_path / "out.wav", pcm)
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getframerate() == 16000
+            assert np.array_equal(np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16), pcm)
@@ -6,6 +6,8 @@ Common HTTP handlers, JSON helpers, and display formatting.
 """
 
 import json
+import math
+import time
 from http.server import BaseHTTPRequestHandler
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -51,13 +53,17 @@ def fmt_price(price: float) -> str:
     return f"{price * 100:.0f}¢"
 
 
+# (suffix, divisor, format) indexed by thousands-exponent: log10(vol) // 3
+_VOLUME_UNITS = (("", 1.0, ".0f"), ("K", 1e3, ".0f"), ("M", 1e6, ".1f"))
+
+
 def fmt_volume(vol: float) -> str:
     """Format volume: 1500000 -> $1.5M"""
-    if vol >= 1_000_000:
-        return f"${vol / 1_000_000:.1f}M"
-    elif vol >= 1_000:
-        return f"${vol / 1_000:.0f}K"
-    return f"${vol:.0f}"
+    i = min(len(_VOLUME_UNITS) - 1, int(math.log10(vol)) // 3) if vol >= 1 else 0
+    if i and vol < _VOLUME_UNITS[i][1]:  # log10 rounds up just below a power of 10
+        i -= 1
+    label, div, spec = _VOLUME_UNITS[i]
+    return f"${vol / div:{spec}}{label}"
 
 
 def fmt_change(change: float) -> str:
@@ -66,15 +72,28 @@ def fmt_change(change: float) -> str:
     return f"{sign}{change:.1f}%"
 
 
+_NOW_CACHE = (0, "")  # (epoch second, formatted HH:MM:SS)
+
+
 def fmt_time(ts: Optional[str] = None) -> str:
     """Format timestamp as HH:MM:SS"""
+    global _NOW_CACHE
     if ts:
         try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+            if ts.endswith("Z") and len(ts) >= 20:
+                # Fast path for the API's "2024-01-31T12:34:56[.fff]Z" form
+                dt = datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                              int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+            else:
+                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
             return dt.strftime("%H:%M:%S")
         except:
             pass
-    return datetime.now().strftime("%H:%M:%S")
+    # Render loops call this many times per second; reformat only on a new second
+    now = int(time.time())
+    if now != _NOW_CACHE[0]:
+        _NOW_CACHE = (now, datetime.fromtimestamp(now).strftime("%H:%M:%S"))
+    return _NOW_CACHE[1]
 
 
 # ============================================================================
@@ -1,3 +1,3 @@
 """Voice trading module for Polymarket"""
 from .recorder import record_push_to_talk, record_duration
-from .transcribe import transcribe, detect_language
+from .transcribe import transcribe, transcribe_array, detect_language, warm_up
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Persistent Claude CLI session
+Starts `claude` once and feeds it prompts over stdin (stream-json), so each
+voice command is a pipe write instead of a fresh process + auth + context load.
+"""
+import json
+import subprocess
+from pathlib import Path
+
+CLAUDE_CMD = [
+    "claude", "-p",
+    "--input-format", "stream-json",
+    "--output-format", "stream-json",
+    "--verbose",
+]
+
+
+class ClaudeSession:
+    """One long-lived `claude` process; conversation context carries across prompts"""
+
+    def __init__(self, cwd: Path):
+        self.cwd = str(cwd)
+        self.proc = None
+
+    def _ensure_started(self):
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                CLAUDE_CMD,
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+
+    def send(self, prompt: str) -> int:
+        """Send one prompt, print Claude's replies as they stream, return 0 on success"""
+        self._ensure_started()
+        msg = {"type": "user", "message": {"role": "user", "content": [{"type": "text", "text": prompt}]}}
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+
+        # Read events until the end-of-turn result
+        for line in self.proc.stdout:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("type") == "assistant":
+                for block in event.get("message", {}).get("content", []):
+                    if block.get("type") == "text":
+                        print(block["text"])
+            elif event.get("type") == "result":
+                return 1 if event.get("is_error") else 0
+
+        # stdout closed: the process exited mid-turn; restart on next send
+        return self.proc.wait()
+
+    def close(self):
+        if self.proc and self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
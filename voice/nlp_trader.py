@@ -5,12 +5,12 @@ Uses Claude API to interpret voice commands and execute trades
 """
 import sys
 import os
-import json
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
 from recorder import record_push_to_talk
 from transcribe import transcribe, detect_language
 from polymarket_api import (
@@ -19,8 +19,12 @@ from polymarket_api import (
 )
 from memory import get_memory, get_mindmap
 
-# Initialize Claude client
-client = Anthropic()
+# Initialize Claude client once. A voice turn (speak, transcribe, confirm)
+# outlasts httpx's default 5s keep-alive, so hold the TLS connection longer
+# instead of re-handshaking on every command.
+client = Anthropic(http_client=DefaultHttpxClient(
+    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=300),
+))
 
 SYSTEM_PROMPT = """You are a Polymarket trading assistant. Convert natural language to trading actions.
 
@@ -37,9 +41,9 @@ Available functions:
 When user gives a natural language command:
 1. Determine what action they want
 2. If they mention a market/event, search for it first
-3. Return a JSON action plan
+3. Return the action plan by calling the trade_plan tool
 
-Response format (JSON only):
+Example plan:
 {
   "thought": "brief analysis of request",
   "actions": [
@@ -59,6 +63,40 @@ If you need more info, set actions to [{"function": "ask", "args": {"question":
 """
 
 
+# Forcing this tool makes the API return the plan as an already-parsed dict
+TRADE_PLAN_TOOL = {
+    "name": "trade_plan",
+    "description": "Submit the trading action plan for the user's command",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "thought": {"type": "string", "description": "Brief analysis of the request"},
+            "actions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "function": {
+                            "type": "string",
+                            "enum": [
+                                "search_markets", "show_event", "place_order",
+                                "get_best_prices", "show_orders", "cancel_all_orders",
+                                "get_positions", "get_balances", "ask",
+                            ],
+                        },
+                        "args": {"type": "object"},
+                    },
+                    "required": ["function"],
+                },
+            },
+            "need_confirmation": {"type": "boolean"},
+            "summary": {"type": "string", "description": "Human readable summary"},
+        },
+        "required": ["thought", "actions", "need_confirmation", "summary"],
+    },
+}
+
+
 def interpret_command(transcript: str, context: str = "") -> dict:
     """Use Claude to interpret natural language command"""
 
@@ -70,20 +108,16 @@ def interpret_command(transcript: str, context: str = "") -> dict:
         model="claude-sonnet-4-20250514",
         max_tokens=1024,
         system=SYSTEM_PROMPT,
+        tools=[TRADE_PLAN_TOOL],
+        tool_choice={"type": "tool", "name": "trade_plan"},
         messages=messages
     )
 
-    # Parse JSON response
-    text = response.content[0].text
-    try:
-        # Find JSON in response
-        start = text.find('{')
-        end = text.rfind('}') + 1
-        if start >= 0 and end > start:
-            return json.loads(text[start:end])
-    except json.JSONDecodeError:
-        pass
+    for block in response.content:
+        if block.type == "tool_use":
+            return block.input
 
+    text = "".join(b.text for b in response.content if b.type == "text")
     return {"thought": "Could not parse", "actions": [], "summary": text}
 
 
@@ -157,16 +191,16 @@ def voice_trading_loop():
 
     while True:
         try:
-            audio_path = record_push_to_talk()
+            audio = record_push_to_talk()
 
-            if audio_path is None:
+            if audio is None:
                 memory.save_all()
                 print("Bye!")
                 break
 
             # Transcribe
             print("Transcribing...")
-            transcript = transcribe(audio_path, language="auto")
+            transcript = transcribe(audio, language="auto")
             print(f'\nYou said: "{transcript}"')
 
             if not transcript or len(transcript) < 3:
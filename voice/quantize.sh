@@ -0,0 +1,26 @@
+#!/bin/bash
+# Quantize the whisper.cpp base model to Q5_0 for faster CPU transcription.
+# transcribe.py picks up models/ggml-base-q5_0.bin automatically when present.
+
+set -e
+
+WHISPER_CPP="${WHISPER_CPP:-$HOME/.claude1/whisper.cpp}"
+SRC="$WHISPER_CPP/models/ggml-base.bin"
+DST="$WHISPER_CPP/models/ggml-base-q5_0.bin"
+
+if [ ! -f "$SRC" ]; then
+    echo "Model not found: $SRC"
+    echo "Download with: (cd $WHISPER_CPP && ./models/download-ggml-model.sh base)"
+    exit 1
+fi
+
+# Newer whisper.cpp builds name the tool whisper-quantize
+QUANTIZE="$WHISPER_CPP/build/bin/whisper-quantize"
+[ -x "$QUANTIZE" ] || QUANTIZE="$WHISPER_CPP/build/bin/quantize"
+if [ ! -x "$QUANTIZE" ]; then
+    echo "quantize tool not built. Run: (cd $WHISPER_CPP && cmake -B build && cmake --build build -j)"
+    exit 1
+fi
+
+"$QUANTIZE" "$SRC" "$DST" q5_0
+echo "✓ Wrote $DST"
@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from voice.recorder import record_until_enter
-from voice.transcribe import transcribe
+from voice.transcribe import transcribe, warm_up
 
 TRANSCRIPT_FILE = Path(__file__).parent / "transcript.txt"
 
@@ -21,6 +21,7 @@ def main():
     print("ENTER = start, ENTER = stop, q = quit")
     print("Transcript saved → tell Claude 'voice' to execute")
     print()
+    warm_up()
 
     while True:
         cmd = input("[ENTER to record, q to quit]: ").strip()
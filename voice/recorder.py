@@ -5,56 +5,175 @@ Hold Enter to record, release to stop
 """
 import sounddevice as sd
 import numpy as np
-import wave
+import os
+import select
 import sys
 import termios
 import tty
 from pathlib import Path
+from typing import Optional
+
+try:
+    from .wav_fast import wav_header, write_wav
+except ImportError:
+    from wav_fast import wav_header, write_wav
 
 SAMPLE_RATE = 16000  # whisper.cpp native rate
 CHANNELS = 1
 OUTPUT_PATH = Path(__file__).parent / "recording.wav"
+MAX_SECONDS = 60  # Initial buffer size; grows if a recording runs longer
+BLOCKSIZE = 512  # 32 ms blocks keep callback work small and jitter low
+REPEAT_DELAY = 0.6  # Longer than the usual keyboard auto-repeat delay
+REPEAT_GAP = 0.15  # Auto-repeat runs at 10+ Hz; a longer gap means SPACE was released
 
+_KEYBOARDS = None  # evdev devices reporting SPACE, [] if unavailable
 
-def record_until_enter() -> Path:
-    """Record until user presses ENTER. Returns path to WAV file."""
-    print("🎤 Recording... press ENTER when done")
 
-    frames = []
+def _raise_thread_priority():
+    """Move the calling (PortAudio callback) thread to SCHED_FIFO if permitted"""
+    if not hasattr(os, "sched_setscheduler"):
+        return  # macOS/Windows: CoreAudio/WASAPI threads are already real-time
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+    except (PermissionError, OSError):
+        pass  # Needs CAP_SYS_NICE or an rtprio limit; normal priority still works
+
 
-    def callback(indata, frame_count, time_info, status):
-        frames.append(indata.copy())
+def _input_stream(callback) -> sd.InputStream:
+    """Low-latency mono int16 input stream feeding callback"""
+    first = [True]
 
-    stream = sd.InputStream(
+    def on_block(indata, frame_count, time_info, status):
+        if first[0]:
+            first[0] = False
+            _raise_thread_priority()
+        callback(indata, frame_count, time_info, status)
+
+    return sd.InputStream(
         samplerate=SAMPLE_RATE,
         channels=CHANNELS,
         dtype='int16',
-        callback=callback
+        blocksize=BLOCKSIZE,
+        latency='low',
+        callback=on_block
     )
 
+
+def _space_keyboards() -> list:
+    """evdev keyboards that report SPACE (Linux, needs read access to /dev/input)"""
+    global _KEYBOARDS
+    if _KEYBOARDS is None:
+        _KEYBOARDS = []
+        try:
+            import evdev
+        except ImportError:
+            return _KEYBOARDS
+        for path in evdev.list_devices():
+            try:
+                dev = evdev.InputDevice(path)
+            except OSError:
+                continue
+            if evdev.ecodes.KEY_SPACE in dev.capabilities().get(evdev.ecodes.EV_KEY, []):
+                _KEYBOARDS.append(dev)
+            else:
+                dev.close()
+    return _KEYBOARDS
+
+
+def _wait_space_release(fd: int):
+    """Block until SPACE is released"""
+    keyboards = _space_keyboards()
+    if keyboards:
+        from evdev import ecodes
+        # The keyboard SPACE is actually held on (the first match may be another device)
+        dev = next((d for d in keyboards if ecodes.KEY_SPACE in d.active_keys()), None)
+        if dev is not None:
+            # Drop events queued since the last recording (typing in between),
+            # or a stale SPACE key-up would end this one immediately
+            while dev.read_one() is not None:
+                pass
+            if ecodes.KEY_SPACE in dev.active_keys():
+                for ev in dev.read_loop():
+                    if ev.type == ecodes.EV_KEY and ev.code == ecodes.KEY_SPACE and ev.value == 0:
+                        break
+            termios.tcflush(fd, termios.TCIFLUSH)  # Drop auto-repeated spaces
+            return
+
+    # Terminal fallback (no evdev, or SPACE not down on any readable keyboard):
+    # auto-repeated spaces arrive while the key is held
+    timeout = REPEAT_DELAY
+    while select.select([fd], [], [], timeout)[0]:
+        if os.read(fd, 1) != b' ':
+            break
+        timeout = REPEAT_GAP
+
+
+class _PcmBuffer:
+    """Pre-allocated int16 capture buffer filled in place by the stream callback"""
+
+    def __init__(self, seconds: int = MAX_SECONDS):
+        self.buf = np.empty(seconds * SAMPLE_RATE, dtype=np.int16)
+        self.n = 0
+
+    def callback(self, indata, frame_count, time_info, status):
+        end = self.n + len(indata)
+        if end > len(self.buf):
+            self.buf = np.resize(self.buf, max(end, 2 * len(self.buf)))
+        self.buf[self.n:end] = indata[:, 0]
+        self.n = end
+
+    def audio(self) -> np.ndarray:
+        return self.buf[:self.n]
+
+
+class _WavStream:
+    """Writes captured frames straight to OUTPUT_PATH; header sizes are fixed up on close"""
+
+    def __init__(self):
+        self.f = open(OUTPUT_PATH, 'wb')
+        self.f.write(wav_header(0, SAMPLE_RATE))
+        self.n = 0
+
+    def callback(self, indata, frame_count, time_info, status):
+        self.f.write(indata)
+        self.n += len(indata)
+
+    def close(self):
+        self.f.seek(0)
+        self.f.write(wav_header(self.n, SAMPLE_RATE))
+        self.f.close()
+
+
+def _save_wav(audio: np.ndarray) -> Path:
+    """Write mono int16 samples to OUTPUT_PATH"""
+    write_wav(OUTPUT_PATH, audio, SAMPLE_RATE)
+
+    duration = len(audio) / SAMPLE_RATE
+    print(f"Saved {duration:.1f}s to {OUTPUT_PATH.name}")
+    return OUTPUT_PATH
+
+
+def record_until_enter(wait=input) -> Optional[np.ndarray]:
+    """Record until user presses ENTER (or wait() returns). Returns 16 kHz mono int16 samples."""
+    print("🎤 Recording... press ENTER when done")
+
+    pcm = _PcmBuffer()
+    stream = _input_stream(pcm.callback)
+
     with stream:
-        input()  # Wait for ENTER
+        wait()  # Wait for ENTER
 
     print("✓ Recording stopped")
 
-    if not frames:
+    if not pcm.n:
         return None
 
-    # Save WAV
-    audio = np.concatenate(frames, axis=0)
-    with wave.open(str(OUTPUT_PATH), 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(SAMPLE_RATE)
-        wf.writeframes(audio.tobytes())
-
-    duration = len(audio) / SAMPLE_RATE
-    print(f"Saved {duration:.1f}s to {OUTPUT_PATH.name}")
-    return OUTPUT_PATH
+    print(f"Captured {pcm.n / SAMPLE_RATE:.1f}s")
+    return pcm.audio()
 
 
-def record_push_to_talk() -> Path:
-    """Record while SPACE is held. Returns path to WAV file."""
+def record_push_to_talk(save: bool = False):
+    """Record while SPACE is held. Returns 16 kHz mono int16 samples (WAV path if save)."""
     print("Hold SPACE to record (release to stop)... [q to quit]")
 
     # Wait for Space press
@@ -75,41 +194,32 @@ def record_push_to_talk() -> Path:
 
         print("\r Recording... ", end="", flush=True)
 
-        frames = []
-
-        def callback(indata, frame_count, time_info, status):
-            frames.append(indata.copy())
+        _space_keyboards()  # Open the keyboards before the stream starts
+        # In memory by default: transcribe() takes the samples directly, no disk round-trip
+        sink = _WavStream() if save else _PcmBuffer()
+        stream = _input_stream(sink.callback)
 
-        stream = sd.InputStream(
-            samplerate=SAMPLE_RATE,
-            channels=CHANNELS,
-            dtype='int16',
-            callback=callback
-        )
-
-        with stream:
-            # Wait for key release
-            sys.stdin.read(1)
+        try:
+            with stream:
+                _wait_space_release(fd)
+        finally:
+            if save:
+                sink.close()
 
         print("\r Done!          ")
 
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-    if not frames:
+    if not sink.n:
         return None
 
-    # Save WAV
-    audio = np.concatenate(frames, axis=0)
-    with wave.open(str(OUTPUT_PATH), 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(SAMPLE_RATE)
-        wf.writeframes(audio.tobytes())
+    if save:
+        print(f"Saved {sink.n / SAMPLE_RATE:.1f}s to {OUTPUT_PATH.name}")
+        return OUTPUT_PATH
 
-    duration = len(audio) / SAMPLE_RATE
-    print(f"Saved {duration:.1f}s to {OUTPUT_PATH.name}")
-    return OUTPUT_PATH
+    print(f"Captured {sink.n / SAMPLE_RATE:.1f}s")
+    return sink.audio()
 
 
 def record_duration(seconds: float) -> Path:
@@ -124,17 +234,10 @@ def record_duration(seconds: float) -> Path:
     )
     sd.wait()
 
-    with wave.open(str(OUTPUT_PATH), 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(SAMPLE_RATE)
-        wf.writeframes(audio.tobytes())
-
-    print(f"Saved to {OUTPUT_PATH.name}")
-    return OUTPUT_PATH
+    return _save_wav(audio)
 
 
 if __name__ == "__main__":
-    path = record_push_to_talk()
+    path = record_push_to_talk(save=True)
     if path:
         print(f"Audio saved: {path}")
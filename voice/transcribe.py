@@ -1,116 +1,288 @@
 #!/usr/bin/env python3
 """
 Whisper transcription for Polish and English
-Uses whisper.cpp or OpenAI whisper as fallback
+Uses whisper.cpp (in-process via pywhispercpp) or faster-whisper / OpenAI whisper as fallback
 """
-import subprocess
 import os
+import re
+import hashlib
+import importlib.util
+from collections import OrderedDict
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from .vad import trim_silence
+except ImportError:
+    from vad import trim_silence
+
 # Paths - adjust for your setup
 WHISPER_CPP = Path.home() / ".claude1/whisper.cpp"
+# Q5_0 moves ~1/3 of the F16 weight bytes per token, roughly 2x faster on CPU.
+# Multilingual (not .en) so Polish keeps working; build it with voice/quantize.sh
+WHISPER_CPP_MODEL_Q = WHISPER_CPP / "models/ggml-base-q5_0.bin"
+WHISPER_CPP_MODEL_F16 = WHISPER_CPP / "models/ggml-base.bin"
+WHISPER_CPP_MODEL = WHISPER_CPP_MODEL_Q if WHISPER_CPP_MODEL_Q.exists() else WHISPER_CPP_MODEL_F16
 WHISPER_MODEL_PL = "jonatasgrosman/whisper-medium-pl-v2"
 WHISPER_MODEL_EN = "base.en"
+SAMPLE_RATE = 16000  # Rate the recorder captures at and whisper expects
+
+# Prefer in-process whisper.cpp if the binding and model are present, else Python.
+# The encoder is compute-bound, so build pywhispercpp with the fastest backend:
+#   macOS:       GGML_METAL=1 WHISPER_COREML=1 pip install --no-binary pywhispercpp pywhispercpp
+#   Linux+CUDA:  GGML_CUDA=1 pip install --no-binary pywhispercpp pywhispercpp
+# CPU builds must have AVX2/F16C (x86) or NEON (ARM) enabled; see backend_info().
+USE_CPP = importlib.util.find_spec("pywhispercpp") is not None and WHISPER_CPP_MODEL.exists()
+
+# Any of these in whisper's system info means a vectorized/accelerated build
+_FAST_BACKENDS = ("AVX2 = 1", "NEON = 1", "METAL = 1", "CUDA = 1", "COREML = 1")
+
+# Loaded once and reused for every utterance (model load is the slow part)
+_CTX = None
+_PL_PIPE = None
+_PY_MODEL = None
+_PY_FASTER = False  # True when _PY_MODEL is a faster-whisper model
+
+# Recent transcripts keyed by (audio hash, language); re-recorded misfires skip whisper
+_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_CACHE_SIZE = 32
+
+try:
+    import xxhash
+
+    def _pcm_hash(pcm: np.ndarray) -> int:
+        return xxhash.xxh3_64_intdigest(pcm)
+except ImportError:
+    def _pcm_hash(pcm: np.ndarray) -> bytes:
+        return hashlib.blake2b(pcm, digest_size=8).digest()
+
+
+def backend_info() -> str:
+    """whisper.cpp build flags, e.g. 'AVX = 1 | AVX2 = 1 | NEON = 0 | ...'"""
+    from pywhispercpp.model import Model
+    return Model.system_info()
+
+
+def _get_ctx():
+    """Load the whisper.cpp model on first use"""
+    global _CTX
+    if _CTX is None:
+        from pywhispercpp.model import Model
+        info = backend_info()
+        if not any(flag in info for flag in _FAST_BACKENDS):
+            print(f"Warning: whisper.cpp built without SIMD/GPU, transcription will be slow ({info})")
+        _CTX = Model(str(WHISPER_CPP_MODEL), n_threads=os.cpu_count(),
+                     print_progress=False, print_realtime=False)
+    return _CTX
+
+
+def transcribe_cpp(audio, language: str = "auto") -> str:
+    """Transcribe a WAV path or float32 samples using the in-process whisper.cpp model"""
+    if not isinstance(audio, np.ndarray):
+        audio = str(audio)
+    segments = _get_ctx().transcribe(audio, language=language)
+    return " ".join(seg.text.strip() for seg in segments).strip()
+
+
+def warm_up(language: str = "en"):
+    """Load the model up front so the first utterance doesn't pay for it"""
+    if USE_CPP:
+        # 100 ms of silence also triggers backend kernel setup
+        _get_ctx().transcribe(np.zeros(1600, dtype=np.float32), language=language)
+    else:
+        try:
+            _get_py_model()
+        except ImportError:
+            pass  # No Python backend either; transcribe() reports it on first use
 
-# Prefer whisper.cpp if built, else Python
-USE_CPP = (WHISPER_CPP / "build/bin/whisper-cli").exists()
 
+def _get_py_model():
+    """Load the Python-side base model on first use, preferring faster-whisper (CTranslate2 int8)"""
+    global _PY_MODEL, _PY_FASTER
+    if _PY_MODEL is None:
+        try:
+            from faster_whisper import WhisperModel
+            _PY_MODEL = WhisperModel("base", compute_type="int8")
+            _PY_FASTER = True
+        except ImportError:
+            try:
+                import whisper
+            except ImportError:
+                raise ImportError("pip install faster-whisper (or openai-whisper)")
+            _PY_MODEL = whisper.load_model("base")
+    return _PY_MODEL
+
+
+def transcribe_python(audio, language: str = "auto") -> str:
+    """Transcribe a WAV path or float32 samples using faster-whisper or the Python whisper library"""
+    model = _get_py_model()
+    if not isinstance(audio, np.ndarray):
+        audio = str(audio)
+    language = None if language == "auto" else language
+
+    if _PY_FASTER:
+        # Log-mel and decoding both run natively in CTranslate2
+        segments, _info = model.transcribe(audio, language=language)
+        return " ".join(seg.text.strip() for seg in segments).strip()
+
+    result = model.transcribe(audio, language=language)
+    return result["text"].strip()
 
-def transcribe_cpp(audio_path: Path, language: str = "auto") -> str:
-    """Transcribe using whisper.cpp CLI"""
-    model_path = WHISPER_CPP / "models/ggml-base.bin"
 
-    cmd = [
-        str(WHISPER_CPP / "build/bin/whisper-cli"),
-        "-m", str(model_path),
-        "-f", str(audio_path),
-        "--no-timestamps",
-        "-l", language if language != "auto" else "auto",
-    ]
+def _get_polish_pipe():
+    """Build the Polish transformers pipeline on first use"""
+    global _PL_PIPE
+    if _PL_PIPE is None:
+        try:
+            import torch
+            from transformers import pipeline
+        except ImportError:
+            raise ImportError("pip install transformers torch")
+
+        cuda = torch.cuda.is_available()
+        _PL_PIPE = pipeline(
+            "automatic-speech-recognition",
+            model=WHISPER_MODEL_PL,
+            chunk_length_s=30,
+            device=0 if cuda else -1,
+            torch_dtype=torch.float16 if cuda else torch.float32,
+        )
+    return _PL_PIPE
+
+
+def transcribe_polish_array(pcm: np.ndarray) -> str:
+    """Transcribe 16 kHz float32 samples using Polish-optimized model"""
+    result = _get_polish_pipe()({"raw": pcm, "sampling_rate": SAMPLE_RATE})
+    return result["text"].strip()
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"whisper.cpp failed: {result.stderr}")
 
-    return result.stdout.strip()
+def transcribe_polish(audio) -> str:
+    """Transcribe a WAV path or float32 samples using Polish-optimized model via transformers"""
+    if isinstance(audio, np.ndarray):
+        return transcribe_polish_array(audio)
+    result = _get_polish_pipe()(str(audio))
+    return result["text"].strip()
 
 
-def transcribe_python(audio_path: Path, language: str = "auto") -> str:
-    """Transcribe using Python whisper library"""
-    try:
-        import whisper
-    except ImportError:
-        raise ImportError("pip install openai-whisper")
+def _transcribe(audio, language: str) -> str:
+    """Pick a backend for a WAV path or float32 samples"""
+    # Polish-specific model
+    if language == "pl":
+        try:
+            return transcribe_polish(audio)
+        except ImportError:
+            print("Polish model unavailable, falling back to base whisper")
 
-    model = whisper.load_model("base")
-    result = model.transcribe(
-        str(audio_path),
-        language=None if language == "auto" else language,
-    )
-    return result["text"].strip()
+    # Use whisper.cpp if available
+    if USE_CPP:
+        return transcribe_cpp(audio, language)
 
+    # Fallback to Python whisper
+    return transcribe_python(audio, language)
 
-def transcribe_polish(audio_path: Path) -> str:
-    """Transcribe using Polish-optimized model via transformers"""
-    try:
-        from transformers import pipeline
-    except ImportError:
-        raise ImportError("pip install transformers torch")
 
-    pipe = pipeline(
-        "automatic-speech-recognition",
-        model=WHISPER_MODEL_PL,
-        chunk_length_s=30,
-    )
+def transcribe_array(pcm_int16: np.ndarray, language: str = "auto") -> str:
+    """Transcribe 16 kHz mono int16 samples without going through a WAV file"""
+    key = (_pcm_hash(np.ascontiguousarray(pcm_int16)), language)
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
 
-    result = pipe(str(audio_path))
-    return result["text"].strip()
+    pcm = np.multiply(pcm_int16, 1.0 / 32768.0, dtype=np.float32)
+    pcm = trim_silence(pcm)
+    # No real speech: skip whisper entirely
+    text = "" if pcm is None else _transcribe(pcm, language)
 
+    _CACHE[key] = text
+    if len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return text
 
-def transcribe(audio_path: Path, language: str = "auto") -> str:
+
+def transcribe(audio, language: str = "auto") -> str:
     """
-    Transcribe audio file to text.
+    Transcribe audio to text.
 
     Args:
-        audio_path: Path to WAV file
+        audio: Path to WAV file, or 16 kHz mono int16 samples from the recorder
         language: "pl" for Polish, "en" for English, "auto" for detection
 
     Returns:
         Transcribed text
     """
-    audio_path = Path(audio_path)
+    if isinstance(audio, np.ndarray):
+        return transcribe_array(audio, language)
+
+    audio_path = Path(audio)
 
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    # Polish-specific model
+    return _transcribe(audio_path, language)
+
+
+def transcribe_batch(audio_paths: list, language: str = "auto") -> list[str]:
+    """
+    Transcribe many audio files in one go.
+
+    Uses faster-whisper's BatchedInferencePipeline when installed, which runs
+    each file's 30 s windows through the encoder as one batch (the win grows
+    with file length). Falls back to calling transcribe() per file, as does
+    Polish, so it gets the same fine-tuned model as single-file transcription.
+    """
     if language == "pl":
-        try:
-            return transcribe_polish(audio_path)
-        except ImportError:
-            print("Polish model unavailable, falling back to base whisper")
+        return [transcribe(p, language) for p in audio_paths]
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return [transcribe(p, language) for p in audio_paths]
 
-    # Use whisper.cpp if available
-    if USE_CPP:
-        return transcribe_cpp(audio_path, language)
+    pipe = BatchedInferencePipeline(model=_get_py_model())
+    texts = []
+    for path in audio_paths:
+        segments, _info = pipe.transcribe(
+            str(path),
+            batch_size=16,
+            language=None if language == "auto" else language,
+        )
+        texts.append(" ".join(seg.text.strip() for seg in segments).strip())
+    return texts
 
-    # Fallback to Python whisper
-    return transcribe_python(audio_path, language)
 
+_POLISH_CHARS = frozenset("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ")
+_POLISH_WORDS = frozenset({"kup", "sprzedaj", "zamówień", "pokaż", "anuluj", "akcji", "po"})
+# Deletes Polish letters; a length change means the text contained one
+_POLISH_CHARS_TABLE = str.maketrans("", "", "".join(_POLISH_CHARS))
 
-def detect_language(text: str) -> str:
-    """Simple language detection based on common Polish characters"""
-    polish_chars = set("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ")
-    polish_words = {"kup", "sprzedaj", "zamówień", "pokaż", "anuluj", "akcji", "po"}
 
-    text_lower = text.lower()
+def _build_word_matcher():
+    """Compile _POLISH_WORDS into one scanner: returns text -> bool (substring match)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        # Same substring semantics, still a single C-level pass
+        pattern = re.compile("|".join(map(re.escape, sorted(_POLISH_WORDS))))
+        return lambda text: pattern.search(text) is not None
 
+    automaton = ahocorasick.Automaton()
+    for word in _POLISH_WORDS:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+_HAS_POLISH_WORD = _build_word_matcher()
+
+
+def detect_language(text: str) -> str:
+    """Simple language detection based on common Polish characters"""
     # Check for Polish-specific characters
-    if any(c in text for c in polish_chars):
+    if len(text.translate(_POLISH_CHARS_TABLE)) != len(text):
         return "pl"
 
     # Check for common Polish words
-    if any(word in text_lower for word in polish_words):
+    if _HAS_POLISH_WORD(text.lower()):
         return "pl"
 
     return "en"
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Voice activity detection with Silero VAD
+Trims silence around speech before it reaches whisper
+"""
+import numpy as np
+
+SAMPLE_RATE = 16000
+MIN_SPEECH_MS = 500  # Less speech than this is treated as a misfire
+
+# Loaded on first use; False once we know silero-vad isn't installed
+_MODEL = None
+
+
+def _get_model():
+    """Load the Silero ONNX model once"""
+    global _MODEL
+    if _MODEL is None:
+        try:
+            from silero_vad import load_silero_vad
+            _MODEL = load_silero_vad(onnx=True)
+        except ImportError:
+            _MODEL = False
+    return _MODEL
+
+
+def trim_silence(pcm: np.ndarray):
+    """
+    Cut float32 16 kHz samples down to the span that contains speech.
+
+    Returns:
+        The speech span, None if there is less than MIN_SPEECH_MS of speech,
+        or the input unchanged if silero-vad is not installed
+    """
+    model = _get_model()
+    if not model:
+        return pcm
+
+    import torch
+    from silero_vad import get_speech_timestamps
+
+    stamps = get_speech_timestamps(torch.from_numpy(pcm), model, sampling_rate=SAMPLE_RATE)
+    speech = sum(s["end"] - s["start"] for s in stamps)
+    if speech < MIN_SPEECH_MS * SAMPLE_RATE // 1000:
+        return None
+
+    return pcm[stamps[0]["start"]:stamps[-1]["end"]]
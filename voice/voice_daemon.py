@@ -3,28 +3,69 @@
 Voice Daemon - Records voice and saves transcript to file
 Claude Code reads the file and executes commands
 """
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from voice.recorder import record_push_to_talk
-from voice.transcribe import transcribe
+from voice.transcribe import transcribe, warm_up
 
 TRANSCRIPT_FILE = Path(__file__).parent / "latest_command.txt"
 HISTORY_FILE = Path(__file__).parent / "command_history.txt"
 
+# Transcribes the previous clip while the next one is being recorded.
+# One worker keeps transcripts in the order they were spoken.
+_TRANSCRIBER = ThreadPoolExecutor(max_workers=1)
+
+# Opened on first save and kept for the daemon's lifetime (no open/close per utterance)
+_TRANSCRIPT_FD = None
+_HISTORY_FD = None
+
+
+def _open_files():
+    global _TRANSCRIPT_FD, _HISTORY_FD
+    if _TRANSCRIPT_FD is None:
+        _TRANSCRIPT_FD = os.open(TRANSCRIPT_FILE, os.O_WRONLY | os.O_CREAT, 0o644)
+        _HISTORY_FD = os.open(HISTORY_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+
+def _say(msg: str):
+    """Print with CRLF: the main thread may have the tty in raw mode while this runs"""
+    sys.stdout.write(msg.replace("\n", "\r\n") + "\r\n")
+    sys.stdout.flush()
+
 
 def save_transcript(text: str):
     """Save transcript for Claude to read"""
-    TRANSCRIPT_FILE.write_text(text)
+    _open_files()
+    data = text.encode()
+    os.ftruncate(_TRANSCRIPT_FD, 0)
+    os.pwrite(_TRANSCRIPT_FD, data, 0)
 
     # Also append to history
-    with open(HISTORY_FILE, "a") as f:
-        f.write(f"{time.strftime('%H:%M:%S')} | {text}\n")
+    os.write(_HISTORY_FD, f"{time.strftime('%H:%M:%S')} | {text}\n".encode())
+
+    _say(f"✓ Saved: {text[:60]}...")
+
 
-    print(f"✓ Saved: {text[:60]}...")
+def _transcribe_and_save(pcm: np.ndarray):
+    """Runs on _TRANSCRIBER"""
+    try:
+        text = transcribe(pcm, "auto")
+        if text and len(text) > 2:
+            save_transcript(text)
+            _say(f'\n"{text}"\n')
+            _say("→ Claude can now read this command")
+        else:
+            _say("(No speech detected)")
+    except Exception as e:
+        _say(f"Error: {e}")
 
 
 def main():
@@ -35,6 +76,7 @@ def main():
     print("Claude will read and execute automatically")
     print("q = quit")
     print()
+    warm_up()
 
     while True:
         try:
@@ -43,15 +85,9 @@ def main():
                 print("Bye!")
                 break
 
+            # Don't wait: start recording the next command while this one transcribes
             print("Transcribing...")
-            text = transcribe(audio, "auto")
-
-            if text and len(text) > 2:
-                save_transcript(text)
-                print(f'\n"{text}"\n')
-                print("→ Claude can now read this command")
-            else:
-                print("(No speech detected)")
+            _TRANSCRIBER.submit(_transcribe_and_save, audio)
 
             print()
 
@@ -61,6 +97,9 @@ def main():
         except Exception as e:
             print(f"Error: {e}")
 
+    # Let the last clip finish transcribing before exiting
+    _TRANSCRIBER.shutdown(wait=True)
+
 
 if __name__ == "__main__":
     main()
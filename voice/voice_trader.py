@@ -6,14 +6,16 @@ Record → Transcribe → Parse → Execute
 Supports Polish and English voice commands.
 Uses memory system to learn across sessions.
 """
+import re
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent dir for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from recorder import record_push_to_talk, record_duration
-from transcribe import transcribe, detect_language
+from transcribe import transcribe, transcribe_batch, detect_language, warm_up
 
 # Import command parser from interactive.py
 from interactive import process_command, current_event, current_markets
@@ -21,8 +23,8 @@ from interactive import process_command, current_event, current_markets
 # Memory system
 from memory import get_memory, get_mindmap
 
-# Polish → English command mapping
-POLISH_COMMANDS = {
+# Polish → English command mapping (read-only)
+POLISH_COMMANDS = MappingProxyType({
     # Actions
     "kup": "buy",
     "kupić": "buy",
@@ -59,18 +61,28 @@ POLISH_COMMANDS = {
     "kwietnia": "apr", "maja": "may", "czerwca": "jun",
     "lipca": "jul", "sierpnia": "aug", "września": "sep",
     "października": "oct", "listopada": "nov", "grudnia": "dec",
-}
+})
 
 
-def translate_polish(text: str) -> str:
-    """Translate Polish voice command to English equivalent"""
-    words = text.lower().split()
-    translated = []
+# Every Polish word as one alternation, longest first; re scans the text in a single C-level pass
+_POLISH_PATTERN = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(POLISH_COMMANDS, key=len, reverse=True))) + r")\b"
+)
+
+
+def _polish_word(m: re.Match) -> str:
+    return POLISH_COMMANDS[m.group(1)]
+
 
-    for word in words:
-        translated.append(POLISH_COMMANDS.get(word, word))
+# Whisper usually emits lowercase already; only pay for lower() when a key could be missed
+_LOWER_NEEDED = re.compile(r"[A-ZĄĆĘŁŃÓŚŹŻ]")
 
-    return " ".join(translated)
+
+def translate_polish(text: str) -> str:
+    """Translate Polish voice command to English equivalent"""
+    if _LOWER_NEEDED.search(text):
+        text = text.lower()
+    return _POLISH_PATTERN.sub(_polish_word, text)
 
 
 def voice_to_command(text: str) -> str:
@@ -106,13 +118,14 @@ def voice_loop():
         print(f"Best practices: {', '.join(best[:3])}")
 
     print()
+    warm_up()
 
     while True:
         try:
             # Record audio
-            audio_path = record_push_to_talk()
+            audio = record_push_to_talk()
 
-            if audio_path is None:
+            if audio is None:
                 # User pressed q or wrong key - check if quit
                 memory.save_all()
                 mindmap.save()
@@ -121,7 +134,7 @@ def voice_loop():
 
             # Transcribe
             print("Transcribing...")
-            text = transcribe(audio_path, language="auto")
+            text = transcribe(audio, language="auto")
             print(f"\nYou said: \"{text}\"")
 
             if not text or len(text) < 2:
@@ -173,9 +186,21 @@ def main():
     parser.add_argument("--lang", choices=["auto", "pl", "en"], default="auto",
                         help="Force language (default: auto-detect)")
     parser.add_argument("--test", type=str, help="Test with audio file instead of mic")
+    parser.add_argument("--test-dir", type=str, help="Test with every .wav file in a directory")
 
     args = parser.parse_args()
 
+    if args.test_dir:
+        # Batch test mode - transcribe a whole directory at once
+        paths = sorted(Path(args.test_dir).glob("*.wav"))
+        if not paths:
+            print(f"No .wav files in {args.test_dir}")
+            return
+        for path, text in zip(paths, transcribe_batch(paths, args.lang)):
+            print(f"{path.name}: {text}")
+            print(f"  Command: {voice_to_command(text)}")
+        return
+
     if args.test:
         # Test mode - process a single audio file
         text = transcribe(Path(args.test), args.lang)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Minimal WAV writer for the recorder's fixed format (mono, 16-bit PCM)
+Packs the 44-byte RIFF header directly instead of going through the wave module
+"""
+import struct
+from pathlib import Path
+
+import numpy as np
+
+# RIFF size, WAVE, fmt chunk (PCM, channels, rate, byte rate, block align, bits), data size
+_HDR_FMT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit
+
+
+def wav_header(num_samples: int, sr: int = 16000) -> bytes:
+    """44-byte header for num_samples mono int16 samples"""
+    data_size = num_samples * CHANNELS * SAMPLE_WIDTH
+    return _HDR_FMT.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, CHANNELS, sr, sr * CHANNELS * SAMPLE_WIDTH, CHANNELS * SAMPLE_WIDTH, 8 * SAMPLE_WIDTH,
+        b"data", data_size,
+    )
+
+
+def write_wav(path: Path, pcm_int16: np.ndarray, sr: int = 16000) -> Path:
+    """Write mono int16 samples as a WAV file in one write"""
+    pcm = np.ascontiguousarray(pcm_int16, dtype=np.int16)
+    with open(path, "wb") as f:
+        f.write(wav_header(pcm.size, sr))
+        f.write(pcm)
+    return Path(path)
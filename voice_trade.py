@@ -5,28 +5,24 @@ Records voice → Transcribes → Sends to Claude CLI
 All existing features (whale spotting, research, memory) work via Claude
 """
 import sys
-import subprocess
-import os
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from voice.recorder import record_push_to_talk
 from voice.transcribe import transcribe
+from voice.claude_session import ClaudeSession
+
+# Started on the first prompt and reused for the whole session
+_CLAUDE = ClaudeSession(Path(__file__).parent)
 
 
 def run_claude_with_prompt(prompt: str):
-    """Run claude CLI with the given prompt"""
+    """Send the prompt to the persistent claude session"""
     print(f"\n→ Sending to Claude: {prompt[:80]}...")
     print("-" * 50)
 
-    # Run claude in non-interactive mode with the prompt
-    result = subprocess.run(
-        ['claude', '-p', prompt],
-        cwd=str(Path(__file__).parent),
-        capture_output=False
-    )
-    return result.returncode
+    return _CLAUDE.send(prompt)
 
 
 def main():
@@ -70,6 +66,8 @@ def main():
         except Exception as e:
             print(f"Error: {e}")
 
+    _CLAUDE.close()
+
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,6 @@
 Voice Trading - One Terminal Flow
 Voice → Transcribe → Claude CLI → Trade
 """
-import subprocess
 import sys
 from pathlib import Path
 
@@ -11,19 +10,19 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from voice.recorder import record_until_enter
 from voice.transcribe import transcribe
+from voice.claude_session import ClaudeSession
+
+# Use claude CLI which has auth + all tools; one process for the whole session
+_CLAUDE = ClaudeSession(Path(__file__).parent)
 
 
 def run_claude(prompt: str):
-    """Run claude CLI with prompt"""
+    """Send prompt to the persistent claude session"""
     print("\n" + "=" * 50)
     print("Claude is thinking...")
     print("=" * 50 + "\n")
 
-    # Use claude CLI which has auth + all tools
-    subprocess.run(
-        ['claude', '-p', prompt, '--no-input'],
-        cwd=str(Path(__file__).parent)
-    )
+    _CLAUDE.send(prompt)
 
 
 def main():
@@ -39,6 +38,7 @@ def main():
 
             if cmd.lower() in ['q', 'quit', 'exit']:
                 print("Bye!")
+                _CLAUDE.close()
                 break
 
             if cmd == '':
@@ -7,12 +7,26 @@ One integrated system with all features.
 """
 import sys
 import json
+import time
+import signal
+import asyncio
+import threading
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+import numpy as np
 from anthropic import Anthropic
 
+try:
+    import orjson
+
+    def _dumps_indent(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_indent(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 # Voice
 from voice.recorder import record_push_to_talk
 from voice.transcribe import transcribe
@@ -20,7 +34,7 @@ from voice.transcribe import transcribe
 # Trading - ALL features
 from polymarket_api import (
     show_event, place_order, place_ladder, quick_buy, quick_sell,
-    get_best_prices, show_orders, cancel_order, cancel_all_orders,
+    get_best_prices, get_open_orders, cancel_order, cancel_all_orders,
     get_positions, get_balances, get_orderbook, search_markets
 )
 from auto import whale_follow, top_volume_bet, fetch_recent_trades
@@ -32,7 +46,7 @@ memory = get_memory()
 mindmap = get_mindmap()
 conversation_history = []
 
-TOOLS = [
+TOOLS = (
     {
         "name": "search_markets",
         "description": "Search Polymarket for markets matching a query",
@@ -148,9 +162,11 @@ TOOLS = [
                 "market_id": {"type": "string"}
             },
             "required": ["market_id"]
-        }
+        },
+        # Cache breakpoint: every tool above is served from the prompt cache
+        "cache_control": {"type": "ephemeral"}
     }
-]
+)
 
 SYSTEM = """You are a Polymarket trading assistant with voice input.
 User speaks commands, you research and execute trades.
@@ -170,129 +186,318 @@ Guidelines:
 
 Be conversational - user is speaking to you."""
 
+# System prompt as a cached block; with the TOOLS breakpoint the whole
+# tools + system prefix is a cache hit on every tool-loop follow-up
+SYSTEM_BLOCKS = ({"type": "text", "text": SYSTEM, "cache_control": {"type": "ephemeral"}},)
 
-def execute_tool(name: str, args: dict) -> str:
-    """Execute a trading tool and return result"""
-    try:
-        if name == "search_markets":
-            results = search_markets(args.get("query", ""))
-            if results:
-                return json.dumps(results[:5], indent=2)
-            return "No markets found"
-
-        elif name == "show_event":
-            markets = show_event(args["slug"])
-            if markets:
-                return f"Loaded {len(markets)} markets:\n" + "\n".join(
-                    f"- {m.get('question', m.get('id'))[:60]}" for m in markets[:5]
-                )
-            return "Event not found"
-
-        elif name == "get_whale_trades":
-            trades = fetch_recent_trades(limit=100)
-            # Filter by min_usd
-            min_usd = args.get("min_usd", 5000)
-            whale_trades = [t for t in trades if float(t.get('size', 0)) * float(t.get('price', 0)) >= min_usd]
-            if whale_trades:
-                return json.dumps(whale_trades[:10], indent=2)
-            return "No whale trades found above ${:.0f}".format(min_usd)
-
-        elif name == "place_order":
-            result = place_order(args["market_id"], args["side"], args["price"], args["size"])
-            return f"Order result: {result}"
-
-        elif name == "quick_buy":
-            result = quick_buy(args["market_id"], args["size"])
-            return f"Quick buy result: {result}"
-
-        elif name == "quick_sell":
-            result = quick_sell(args["market_id"], args["size"])
-            return f"Quick sell result: {result}"
-
-        elif name == "place_ladder":
-            results = place_ladder(
-                args["market_id"], args["side"],
-                args["start_price"], args["end_price"],
-                args["num_orders"], args["size_per_order"]
+# Request parameters that never change between turns, built once at import
+CHAT_PARAMS = {
+    "model": "claude-sonnet-4-20250514",
+    "max_tokens": 4096,
+    "system": SYSTEM_BLOCKS,
+    "tools": TOOLS,
+}
+
+
+# Positions/balances prefetched while the CLI waits for input
+PREFETCH_SECONDS = 5
+_ACCOUNT = {"positions": None, "balances": None, "at": 0.0, "gen": 0}
+# Set on Ctrl+C: worker threads stop streaming and skip trades still pending
+_CANCEL = threading.Event()
+# Tools that change positions/balances; they invalidate the prefetched copy
+_TRADING_TOOLS = {"place_order", "quick_buy", "quick_sell", "place_ladder", "cancel_all_orders"}
+
+
+async def prefetch_loop():
+    """Keep positions/balances warm so status-like tool calls return instantly"""
+    while True:
+        try:
+            gen = _ACCOUNT["gen"]
+            positions, balances = await asyncio.gather(
+                asyncio.to_thread(get_positions), asyncio.to_thread(get_balances)
             )
-            return f"Ladder placed: {len(results)} orders"
+            # A trade during the fetch invalidated it; this read may predate the trade
+            if _ACCOUNT["gen"] == gen:
+                _ACCOUNT.update(positions=positions, balances=balances, at=time.monotonic())
+        except Exception:
+            pass
+        await asyncio.sleep(PREFETCH_SECONDS)
+
+
+def _prefetched(key: str):
+    """Prefetched value if it is recent enough, else None"""
+    if _ACCOUNT[key] is not None and time.monotonic() - _ACCOUNT["at"] < 2 * PREFETCH_SECONDS:
+        return _ACCOUNT[key]
+    return None
+
+
+def _handle_search(args: dict) -> str:
+    results = search_markets(args.get("query", ""))
+    if results:
+        return _dumps_indent(results[:5])
+    return "No markets found"
+
+
+def _handle_show_event(args: dict) -> str:
+    markets = show_event(args["slug"])
+    if markets:
+        return f"Loaded {len(markets)} markets:\n" + "\n".join(
+            f"- {m.get('question', m.get('id'))[:60]}" for m in markets[:5]
+        )
+    return "Event not found"
+
+
+def _handle_whale_trades(args: dict) -> str:
+    trades = fetch_recent_trades(limit=100)
+    # Filter by min_usd
+    min_usd = args.get("min_usd", 5000)
+    n = len(trades)
+    sizes = np.fromiter((float(t.get('size', 0)) for t in trades), dtype=np.float64, count=n)
+    prices = np.fromiter((float(t.get('price', 0)) for t in trades), dtype=np.float64, count=n)
+    whale_trades = [trades[i] for i in np.flatnonzero(sizes * prices >= min_usd)]
+    if whale_trades:
+        return _dumps_indent(whale_trades[:10])
+    return "No whale trades found above ${:.0f}".format(min_usd)
+
+
+def _handle_place_order(args: dict) -> str:
+    result = place_order(args["market_id"], args["side"], args["price"], args["size"])
+    return f"Order result: {result}"
+
+
+def _handle_quick_buy(args: dict) -> str:
+    result = quick_buy(args["market_id"], args["size"])
+    return f"Quick buy result: {result}"
+
+
+def _handle_quick_sell(args: dict) -> str:
+    result = quick_sell(args["market_id"], args["size"])
+    return f"Quick sell result: {result}"
+
+
+def _handle_place_ladder(args: dict) -> str:
+    results = place_ladder(
+        args["market_id"], args["side"],
+        args["start_price"], args["end_price"],
+        args["num_orders"], args["size_per_order"]
+    )
+    return f"Ladder placed: {len(results)} orders"
+
+
+def _handle_show_orders(args: dict) -> str:
+    orders = get_open_orders()
+    if orders:
+        return _dumps_indent(orders)
+    return "No open orders"
+
+
+def _handle_cancel_all(args: dict) -> str:
+    result = cancel_all_orders()
+    return f"Cancelled: {result}"
+
+
+def _handle_positions(args: dict) -> str:
+    positions = _prefetched("positions")
+    if positions is None:
+        positions = get_positions()
+    if positions:
+        return _dumps_indent(positions)
+    return "No positions"
 
-        elif name == "show_orders":
-            import io
-            from contextlib import redirect_stdout
-            out = io.StringIO()
-            with redirect_stdout(out):
-                show_orders()
-            return out.getvalue() or "No open orders"
 
-        elif name == "cancel_all_orders":
-            result = cancel_all_orders()
-            return f"Cancelled: {result}"
+def _handle_balances(args: dict) -> str:
+    balances = _prefetched("balances")
+    if balances is None:
+        balances = get_balances()
+    return f"USDC: ${balances.get('usdc', 0):.2f}"
 
-        elif name == "get_positions":
-            positions = get_positions()
-            if positions:
-                return json.dumps(positions, indent=2)
-            return "No positions"
 
-        elif name == "get_balances":
-            balances = get_balances()
-            return f"USDC: ${balances.get('usdc', 0):.2f}"
+def _handle_best_prices(args: dict) -> str:
+    prices = get_best_prices(args["market_id"])
+    return f"Bid: {prices['best_bid']*100:.1f}¢, Ask: {prices['best_ask']*100:.1f}¢"
 
-        elif name == "get_best_prices":
-            prices = get_best_prices(args["market_id"])
-            return f"Bid: {prices['best_bid']*100:.1f}¢, Ask: {prices['best_ask']*100:.1f}¢"
 
-        else:
-            return f"Unknown tool: {name}"
+# Tool name -> handler; one dict lookup per tool_use
+HANDLERS = {
+    "search_markets": _handle_search,
+    "show_event": _handle_show_event,
+    "get_whale_trades": _handle_whale_trades,
+    "place_order": _handle_place_order,
+    "quick_buy": _handle_quick_buy,
+    "quick_sell": _handle_quick_sell,
+    "place_ladder": _handle_place_ladder,
+    "show_orders": _handle_show_orders,
+    "cancel_all_orders": _handle_cancel_all,
+    "get_positions": _handle_positions,
+    "get_balances": _handle_balances,
+    "get_best_prices": _handle_best_prices,
+}
 
+
+def execute_tool(name: str, args: dict) -> str:
+    """Execute a trading tool and return result"""
+    handler = HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}"
+    if name in _TRADING_TOOLS:
+        if _CANCEL.is_set():
+            return "Cancelled by user (Ctrl+C)"
+        _ACCOUNT.update(positions=None, balances=None, gen=_ACCOUNT["gen"] + 1)
+    try:
+        return handler(args)
     except Exception as e:
         return f"Error: {e}"
 
 
-def chat(user_message: str) -> str:
-    """Send message to Claude and handle tool calls"""
-    conversation_history.append({"role": "user", "content": user_message})
-
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        system=SYSTEM,
-        tools=TOOLS,
-        messages=conversation_history
+async def _execute_tools(tool_blocks: list) -> list:
+    """Run reads concurrently up to the first trade, then everything else in block order"""
+    # Anything after a trade may depend on it (cancel then place, buy then positions)
+    first_trade = next(
+        (i for i, b in enumerate(tool_blocks) if b.name in _TRADING_TOOLS), len(tool_blocks)
     )
+    results = list(await asyncio.gather(*[
+        asyncio.to_thread(execute_tool, b.name, b.input) for b in tool_blocks[:first_trade]
+    ]))
+    for b in tool_blocks[first_trade:]:
+        results.append(await asyncio.to_thread(execute_tool, b.name, b.input))
+    return results
+
+
+# Rolling window: once history passes HISTORY_MAX messages, the oldest
+# ~HISTORY_SUMMARIZE are folded into a short summary
+HISTORY_MAX = 40
+HISTORY_SUMMARIZE = 20
+SUMMARY_MODEL = "claude-3-5-haiku-20241022"
+SUMMARY_PROMPT = ("Summarize the above trading session in under 300 tokens, preserving "
+                  "open positions, active orders, and the user's intent.")
+
+
+def compact_history():
+    """Replace the oldest turns with a summary, cutting only at a fresh user turn"""
+    if len(conversation_history) <= HISTORY_MAX:
+        return
+    # A plain-text user message starts a turn; cutting there never splits tool_use/tool_result
+    cut = next((i for i in range(HISTORY_SUMMARIZE, len(conversation_history))
+                if conversation_history[i]["role"] == "user"
+                and isinstance(conversation_history[i]["content"], str)), None)
+    if cut is None:
+        return
+    try:
+        response = client.messages.create(
+            **{**CHAT_PARAMS, "model": SUMMARY_MODEL, "max_tokens": 500},
+            tool_choice={"type": "none"},
+            messages=conversation_history[:cut] + [{"role": "user", "content": SUMMARY_PROMPT}],
+        )
+    except Exception:
+        return  # Keep full history; retried after the next turn
+    summary = "".join(b.text for b in response.content if b.type == "text")
+    first = conversation_history[cut]
+    conversation_history[:cut + 1] = [{
+        "role": "user",
+        "content": f"[SESSION SUMMARY]\n{summary}\n\n{first['content']}",
+    }]
+
 
-    # Process response
-    assistant_content = []
-    final_text = ""
+def chat(user_message: str) -> str:
+    """Send message to Claude and handle tool calls; text is printed as it streams"""
+    conversation_history.append({"role": "user", "content": user_message})
 
-    for block in response.content:
-        if block.type == "text":
-            final_text += block.text
-            assistant_content.append(block)
-        elif block.type == "tool_use":
-            assistant_content.append(block)
+    while True:
+        # On Ctrl+C stop before the next request; history still ends on a user turn
+        if _CANCEL.is_set():
+            return ""
+        with client.messages.stream(**CHAT_PARAMS, messages=conversation_history) as stream:
+            for chunk in stream.text_stream:
+                if _CANCEL.is_set():
+                    return ""
+                print(chunk, end="", flush=True)
+            response = stream.get_final_message()
+
+        # Process response
+        assistant_content = list(response.content)
+        conversation_history.append({"role": "assistant", "content": assistant_content})
+        tool_blocks = [b for b in assistant_content if b.type == "tool_use"]
+
+        # Every tool_use needs a tool_result, whatever the stop reason (e.g. max_tokens)
+        if not tool_blocks:
+            compact_history()
+            return "".join(b.text for b in assistant_content if b.type == "text")
+
+        for block in tool_blocks:
             print(f"\n🔧 {block.name}({json.dumps(block.input)})")
 
-            # Execute tool
-            result = execute_tool(block.name, block.input)
+        # Execute this turn's tools (independent reads concurrently)
+        results = asyncio.run(_execute_tools(tool_blocks))
+        for result in results:
             print(f"   → {result[:200]}...")
 
-            # Add to conversation
-            conversation_history.append({"role": "assistant", "content": assistant_content})
-            conversation_history.append({
-                "role": "user",
-                "content": [{"type": "tool_result", "tool_use_id": block.id, "content": result}]
-            })
+        # One user message carries every tool_result, then ask Claude again
+        conversation_history.append({
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": block.id, "content": result}
+                for block, result in zip(tool_blocks, results)
+            ]
+        })
 
-            # Continue conversation
-            return chat("")  # Recurse to get final response
 
-    conversation_history.append({"role": "assistant", "content": assistant_content})
-    return final_text
+_PROMPT = None
+_INPUT = None  # Fallback input() thread; outlives a cancelled read and is reused
 
 
-def main():
+async def read_line(message: str) -> str:
+    """Read a line without blocking the event loop (prompt_toolkit if installed)"""
+    global _PROMPT, _INPUT
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.patch_stdout import patch_stdout
+    except ImportError:
+        if _INPUT is None:
+            _INPUT = asyncio.ensure_future(asyncio.to_thread(input, message))
+        try:
+            return await asyncio.shield(_INPUT)
+        finally:
+            if _INPUT.done():
+                _INPUT = None
+
+    if _PROMPT is None:
+        _PROMPT = PromptSession()
+    with patch_stdout():
+        # handle_sigint=False: prompt_toolkit would otherwise remove main_async's
+        # SIGINT handler on exit; Ctrl+C in the prompt still raises KeyboardInterrupt
+        return await _PROMPT.prompt_async(message, handle_sigint=False)
+
+
+async def in_thread(func, *args):
+    """Run func in a worker thread; on Ctrl+C wait for it to stop (threads can't be killed)"""
+    fut = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        print("\nStopping...")
+        while not fut.done():
+            try:
+                await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                pass  # Repeated Ctrl+C while stopping
+            except Exception:
+                pass
+        raise
+
+
+async def record_voice():
+    """Record until ENTER; Ctrl+C stops the recording too"""
+    from voice.recorder import record_until_enter
+    stop = threading.Event()
+    recording = asyncio.ensure_future(asyncio.to_thread(record_until_enter, stop.wait))
+    try:
+        await read_line("")
+    finally:
+        stop.set()
+    return await recording
+
+
+async def main_async():
     print("=" * 60)
     print("  Claude Voice Trader - Full System")
     print("=" * 60)
@@ -308,27 +513,30 @@ def main():
     if context:
         print("[Memory loaded]")
 
-    while True:
+    prefetch = asyncio.create_task(prefetch_loop())
+
+    async def turn() -> bool:
+        """One prompt → (record → transcribe) → Claude round; False to quit"""
         try:
-            mode = input("\n[ENTER=voice, or type command]: ").strip()
+            print()
+            mode = (await read_line("[ENTER=voice, or type command]: ")).strip()
 
             if mode.lower() in ['q', 'quit', 'exit']:
                 memory.save_all()
                 print("Memory saved. Bye!")
-                break
+                return False
 
             if mode == '' or mode.lower() == 'v':
                 # Voice mode - record until ENTER
-                from voice.recorder import record_until_enter
-                audio = record_until_enter()
+                audio = await record_voice()
                 if audio is None:
-                    continue
+                    return True
 
                 print("Transcribing...")
-                text = transcribe(audio, "auto")
+                text = await in_thread(transcribe, audio, "auto")
                 if not text or len(text) < 3:
                     print("(No speech detected)")
-                    continue
+                    return True
                 print(f'\n🎤 "{text}"')
             else:
                 # Text mode
@@ -336,19 +544,55 @@ def main():
 
             # Send to Claude
             print("\n" + "-" * 40)
-            response = chat(text)
-            print(f"\n{response}")
+            response = await in_thread(chat, text)
+            print()
 
             # Save to memory
             memory.record_query(text, response[:100])
-
+            return True
         except KeyboardInterrupt:
+            # Ctrl+C inside the prompt_toolkit prompt; a KeyboardInterrupt
+            # escaping a task would stop the event loop
+            raise asyncio.CancelledError from None
+
+    # Ctrl+C cancels the current turn and returns to the prompt instead of
+    # ending asyncio.run; worker threads see _CANCEL and wind down
+    loop = asyncio.get_running_loop()
+    step = None
+
+    def interrupt():
+        _CANCEL.set()
+        if step is not None:
+            step.cancel()
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, interrupt)
+    except NotImplementedError:
+        pass  # Windows: default Ctrl+C handling
+
+    while True:
+        _CANCEL.clear()
+        step = asyncio.create_task(turn())
+        try:
+            if not await step:
+                break
+        except asyncio.CancelledError:
             print("\n(Ctrl+C) Type 'q' to quit")
         except Exception as e:
             print(f"Error: {e}")
             import traceback
             traceback.print_exc()
 
+    prefetch.cancel()
+    try:
+        loop.remove_signal_handler(signal.SIGINT)
+    except NotImplementedError:
+        pass
+
+
+def main():
+    asyncio.run(main_async())
+
 
 if __name__ == "__main__":
     main()
@@ -5,7 +5,10 @@ FastAPI + WebSocket + Voice
 """
 import sys
 import json
+import time
 import asyncio
+import importlib.util
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
@@ -14,13 +17,29 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+
+try:
+    from starlette_compress import CompressMiddleware  # brotli/zstd/gzip
+except ImportError:
+    from fastapi.middleware.gzip import GZipMiddleware as CompressMiddleware
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    _dumps = orjson.dumps
+except ImportError:
+    DefaultResponse = JSONResponse
+    _dumps = lambda obj: json.dumps(obj).encode()
 
 from interactive import process_command, current_event, current_markets
-from polymarket_api import get_positions, get_balances, show_orders
+from polymarket_api import (
+    get_client, get_positions, get_balances, get_open_orders, format_orders, keep_alive,
+    cache_stats,
+)
 from memory import get_memory, get_mindmap
 
-app = FastAPI(title="Claude Trader")
+app = FastAPI(title="Claude Trader", default_response_class=DefaultResponse)
 
 # Memory instances
 memory = get_memory()
@@ -29,10 +48,132 @@ mindmap = get_mindmap()
 # Serve static files
 STATIC_DIR = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.add_middleware(CompressMiddleware, minimum_size=500)  # HTTP only; WebSocket frames pass through
+STATIC_CACHE = {"Cache-Control": "public, max-age=3600"}
 
 # Store for connected clients
 clients: list[WebSocket] = []
 
+KEEPALIVE_SECONDS = 20  # Well under typical idle-connection timeouts
+MEMORY_CHECKPOINT_SECONDS = 60  # Records are logged immediately; this just bounds log size
+
+
+async def keepalive_worker():
+    """Ping Polymarket periodically so the first command after idle skips the TLS handshake"""
+    while True:
+        await asyncio.sleep(KEEPALIVE_SECONDS)
+        await asyncio.to_thread(keep_alive)
+
+
+@app.on_event("startup")
+async def start_keepalive():
+    asyncio.create_task(keepalive_worker())
+
+
+# Account cache: status/positions read from memory. The user channel only
+# reports order/trade events, so each burst of events triggers one REST refresh.
+USER_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+ACCOUNT_MAX_AGE = 60  # Seconds before a read refreshes anyway (no stream, missed events)
+ACCOUNT_BATCH_SECONDS = 0.05
+
+_ACCOUNT = {"positions": [], "balances": {}, "updated": None}
+_ACCOUNT_EVENTS: asyncio.Queue = asyncio.Queue(maxsize=1000)
+
+
+async def refresh_account():
+    """Fetch positions and balances concurrently into the cache"""
+    positions, balances = await asyncio.gather(
+        asyncio.to_thread(get_positions), asyncio.to_thread(get_balances)
+    )
+    _ACCOUNT.update(positions=positions or [], balances=balances or {}, updated=time.monotonic())
+
+
+async def account_snapshot() -> dict:
+    """Cached positions/balances; only hits REST when the cache is empty or stale"""
+    updated = _ACCOUNT["updated"]
+    if updated is None or time.monotonic() - updated > ACCOUNT_MAX_AGE:
+        await refresh_account()
+    return _ACCOUNT
+
+
+def invalidate_account():
+    _ACCOUNT["updated"] = None
+
+
+async def user_ws_worker():
+    """Subscribe to the authenticated user channel and queue its events"""
+    try:
+        import websockets
+        creds = (await asyncio.to_thread(get_client)).creds
+    except Exception:
+        return  # No websockets lib or no credentials: reads fall back to ACCOUNT_MAX_AGE
+
+    subscribe = json.dumps({
+        "auth": {"apiKey": creds.api_key, "secret": creds.api_secret, "passphrase": creds.api_passphrase},
+        "type": "user",
+        "markets": [],
+    })
+    while True:
+        try:
+            async with websockets.connect(USER_WS_URL) as ws:
+                await ws.send(subscribe)
+                async for msg in ws:
+                    try:
+                        _ACCOUNT_EVENTS.put_nowait(msg)
+                    except asyncio.QueueFull:
+                        pass  # A refresh is already pending and will cover it
+        except Exception:
+            invalidate_account()
+            await asyncio.sleep(5)
+
+
+async def account_drain_loop():
+    """Coalesce bursts of user-channel events into one cache refresh"""
+    while True:
+        await _ACCOUNT_EVENTS.get()
+        await asyncio.sleep(ACCOUNT_BATCH_SECONDS)
+        while not _ACCOUNT_EVENTS.empty():
+            _ACCOUNT_EVENTS.get_nowait()
+        try:
+            await refresh_account()
+        except Exception:
+            invalidate_account()
+
+
+async def memory_checkpoint_loop():
+    """Periodically snapshot logged memory records and reset the log"""
+    while True:
+        await asyncio.sleep(MEMORY_CHECKPOINT_SECONDS)
+        # On the loop thread: handlers mutate memory here too, so no locking needed
+        memory.checkpoint()
+
+
+@app.on_event("startup")
+async def start_memory_checkpoints():
+    asyncio.create_task(memory_checkpoint_loop())
+
+
+@app.on_event("shutdown")
+async def checkpoint_memory():
+    memory.checkpoint()
+
+
+@app.on_event("startup")
+async def start_account_stream():
+    asyncio.create_task(user_ws_worker())
+    asyncio.create_task(account_drain_loop())
+
+
+OUTBOX_SIZE = 256  # Messages buffered per client before old output is dropped
+COALESCE_SECONDS = 0.005  # Sends within this window go out as one frame
+
+# Deterministic commands whose past results aren't worth a memory lookup
+_TRIVIAL = frozenset({
+    "orders", "order", "positions", "balances", "cancel all", "status", "help",
+    "memory", "insights", "clear", "q", "quit", "exit",
+})
+MIN_SIMILAR_LEN = 8  # Shorter commands are too generic to match usefully
+
 
 class TerminalSession:
     """Manages a terminal session with command history"""
@@ -40,10 +181,53 @@ class TerminalSession:
     def __init__(self, ws: WebSocket):
         self.ws = ws
         self.history: list[str] = []
+        # Bounded outbox drained by one writer task, so a slow client
+        # can't grow memory or stall command processing
+        self.outbox: deque = deque()
+        self.outbox_ready = asyncio.Event()
+        self.writer_task = asyncio.create_task(self._writer())
+
+    async def _writer(self):
+        try:
+            while True:
+                await self.outbox_ready.wait()
+                await asyncio.sleep(COALESCE_SECONDS)  # Let the rest of the burst queue up
+                self.outbox_ready.clear()
+                if self.outbox:
+                    await self.ws.send_bytes(self._frame())
+        except (WebSocketDisconnect, RuntimeError):
+            pass  # Client went away; endpoint cleans up
+
+    def _drop_oldest(self):
+        """Make room: drop the oldest plain output, keeping prompts/errors if possible"""
+        for i, (msg_type, _) in enumerate(self.outbox):
+            if msg_type == "output":
+                del self.outbox[i]
+                return
+        self.outbox.popleft()
+
+    def _frame(self) -> bytes:
+        """Drain the outbox into one frame: a single message, or {"batch": [...]}"""
+        msgs = [msg for _, msg in self.outbox]
+        self.outbox.clear()
+        return _dumps(msgs[0] if len(msgs) == 1 else {"batch": msgs})
 
     async def send(self, text: str, msg_type: str = "output"):
-        """Send message to client"""
-        await self.ws.send_json({"type": msg_type, "content": text})
+        """Queue message for the client"""
+        if len(self.outbox) >= OUTBOX_SIZE:
+            self._drop_oldest()
+        self.outbox.append((msg_type, {"type": msg_type, "content": text}))
+        self.outbox_ready.set()
+
+    async def close(self):
+        """Stop the writer, then flush anything still queued if the socket allows"""
+        self.writer_task.cancel()
+        await asyncio.gather(self.writer_task, return_exceptions=True)
+        try:
+            if self.outbox:
+                await self.ws.send_bytes(self._frame())
+        except Exception:
+            pass
 
     async def send_prompt(self):
         """Send command prompt"""
@@ -82,8 +266,17 @@ class TerminalSession:
             await self.send_insights()
             return
 
+        if cmd.lower() in ['orders', 'order']:
+            try:
+                await self.send(format_orders(get_open_orders()))
+            except Exception as e:
+                await self.send(f"Error: {e}", "error")
+            return
+
         # Check memory for similar past queries
-        similar = memory.find_similar_query(cmd)
+        similar = None
+        if len(cmd) >= MIN_SIMILAR_LEN and cmd.lower() not in _TRIVIAL:
+            similar = memory.find_similar_query(cmd)
         if similar:
             await self.send(f"[Memory: {similar['result'][:60]}...]", "info")
 
@@ -100,6 +293,7 @@ class TerminalSession:
             memory.record_query(cmd, result[:100] if result else "executed")
             if 'buy' in cmd.lower() or 'sell' in cmd.lower():
                 memory.record_trade({"command": cmd})
+                invalidate_account()
 
         except Exception as e:
             await self.send(f"Error: {e}", "error")
@@ -134,8 +328,9 @@ class TerminalSession:
     async def send_status(self):
         """Send current trading status"""
         try:
-            positions = get_positions() or []
-            balances = get_balances() or {}
+            account = await account_snapshot()
+            positions = account["positions"]
+            balances = account["balances"]
 
             status = [
                 "=== Trading Status ===",
@@ -178,15 +373,16 @@ Memory learns from your trades and improves over time.
 @app.get("/")
 async def root():
     """Serve main terminal page"""
-    return FileResponse(STATIC_DIR / "terminal.html")
+    return FileResponse(STATIC_DIR / "terminal.html", headers=STATIC_CACHE)
 
 
 @app.get("/api/status")
 async def api_status():
     """API endpoint for trading status"""
     try:
-        positions = get_positions() or []
-        balances = get_balances() or {}
+        account = await account_snapshot()
+        positions = account["positions"]
+        balances = account["balances"]
         return {
             "positions": len(positions),
             "usdc": balances.get("usdc", 0),
@@ -201,13 +397,7 @@ async def api_status():
 async def api_orders():
     """API endpoint for open orders"""
     try:
-        # Capture show_orders output
-        import io
-        from contextlib import redirect_stdout
-        output = io.StringIO()
-        with redirect_stdout(output):
-            show_orders()
-        return {"orders": output.getvalue()}
+        return {"orders": get_open_orders()}
     except Exception as e:
         return {"error": str(e)}
 
@@ -216,12 +406,18 @@ async def api_orders():
 async def api_positions():
     """API endpoint for positions"""
     try:
-        positions = get_positions() or []
-        return {"positions": positions}
+        account = await account_snapshot()
+        return {"positions": account["positions"]}
     except Exception as e:
         return {"error": str(e)}
 
 
+@app.get("/api/cache")
+async def api_cache():
+    """API endpoint for search/event cache hit stats"""
+    return cache_stats()
+
+
 @app.get("/api/memory")
 async def api_memory():
     """API endpoint for trading memory"""
@@ -294,6 +490,8 @@ async def websocket_endpoint(websocket: WebSocket):
         await session.send(f"Connection error: {e}", "error")
         if websocket in clients:
             clients.remove(websocket)
+    finally:
+        await session.close()
 
 
 def run():
@@ -301,7 +499,10 @@ def run():
     import uvicorn
     print("Starting Claude Trader Web Terminal...")
     print("Open http://localhost:8000 in your browser")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools come with uvicorn[standard]; not available on Windows
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=loop, http=http, ws="websockets")
 
 
 if __name__ == "__main__":